@@ -3,13 +3,49 @@
 import asyncio
 import json
 import logging
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
 import nats
+import numpy as np
 from nats.aio.client import Client as NATS
 
 logger = logging.getLogger(__name__)
 
+# Publishes are buffered and written by nats-py's flusher task; a larger
+# buffer lets bursts from one handler go out in a single socket write
+NATS_PENDING_SIZE = 8 * 1024 * 1024
+NATS_FLUSHER_QUEUE_SIZE = 1024
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Accept NumPy values, which json.dumps rejects, and coerce int dict
+    # keys to strings the way json.dumps does
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy values for the stdlib encoder, as orjson does natively."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_message(data: Dict[str, Any]) -> bytes:
+    """Encode a message payload as JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(data, default=_json_default).encode()
+
+
+def decode_message(payload: bytes) -> Any:
+    """Decode a JSON message payload."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class NATSClient:
     """NATS client wrapper for pub/sub messaging."""
@@ -22,7 +58,11 @@ class NATSClient:
     async def connect(self) -> None:
         """Connect to NATS server."""
         try:
-            self.nc = await nats.connect(self.nats_url)
+            self.nc = await nats.connect(
+                self.nats_url,
+                pending_size=NATS_PENDING_SIZE,
+                flusher_queue_size=NATS_FLUSHER_QUEUE_SIZE,
+            )
             logger.info(f"Connected to NATS at {self.nats_url}")
         except Exception as e:
             logger.error(f"Failed to connect to NATS: {e}")
@@ -34,35 +74,69 @@ class NATSClient:
             await self.nc.close()
             logger.info("Disconnected from NATS")
     
-    async def publish(self, subject: str, data: Dict[str, Any]) -> None:
-        """Publish message to a subject."""
+    async def publish(
+        self,
+        subject: str,
+        data: Union[Dict[str, Any], bytes],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Publish message to a subject.
+        
+        ``data`` may be a dict (JSON-encoded here) or an already-encoded payload.
+        Optional ``headers`` travel as NATS message headers.
+        """
         if not self.nc:
             raise RuntimeError("NATS client not connected")
         
         try:
-            message = json.dumps(data).encode()
-            await self.nc.publish(subject, message)
+            message = data if isinstance(data, bytes) else encode_message(data)
+            await self.nc.publish(subject, message, headers=headers)
             logger.debug(f"Published message to {subject}")
         except Exception as e:
             logger.error(f"Failed to publish to {subject}: {e}")
             raise
     
-    async def subscribe(self, subject: str, handler: Callable) -> None:
-        """Subscribe to a subject with a handler function."""
+    async def subscribe(
+        self,
+        subject: str,
+        handler: Callable,
+        queue: Optional[str] = None,
+        raw: bool = False,
+        with_headers: bool = False,
+        pending_msgs_limit: Optional[int] = None,
+        pending_bytes_limit: Optional[int] = None,
+    ) -> None:
+        """Subscribe to a subject with a handler function.
+        
+        When ``queue`` is given, the subscription joins that queue group and the
+        server delivers each message to only one member of the group. With
+        ``raw=True`` the handler receives the undecoded payload bytes. With
+        ``with_headers=True`` it also receives the message headers (an empty
+        dict when there are none) as a second argument. The pending limits
+        bound the client-side backlog; messages beyond them are dropped.
+        """
         if not self.nc:
             raise RuntimeError("NATS client not connected")
         
         async def message_handler(msg):
             try:
-                data = json.loads(msg.data.decode())
-                await handler(data)
+                data = msg.data if raw else decode_message(msg.data)
+                if with_headers:
+                    await handler(data, msg.headers or {})
+                else:
+                    await handler(data)
             except Exception as e:
                 logger.error(f"Error handling message from {subject}: {e}")
         
         try:
-            sub = await self.nc.subscribe(subject, cb=message_handler)
+            limits = {}
+            if pending_msgs_limit is not None:
+                limits["pending_msgs_limit"] = pending_msgs_limit
+            if pending_bytes_limit is not None:
+                limits["pending_bytes_limit"] = pending_bytes_limit
+            sub = await self.nc.subscribe(subject, queue=queue or "", cb=message_handler, **limits)
             self.subscriptions[subject] = sub
-            logger.info(f"Subscribed to {subject}")
+            logger.info(f"Subscribed to {subject}" + (f" (queue {queue})" if queue else ""))
         except Exception as e:
             logger.error(f"Failed to subscribe to {subject}: {e}")
             raise
@@ -73,9 +147,9 @@ class NATSClient:
             raise RuntimeError("NATS client not connected")
         
         try:
-            message = json.dumps(data).encode()
+            message = encode_message(data)
             response = await self.nc.request(subject, message, timeout=timeout)
-            return json.loads(response.data.decode())
+            return decode_message(response.data)
         except Exception as e:
             logger.error(f"Request to {subject} failed: {e}")
             raise
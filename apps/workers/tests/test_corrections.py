@@ -0,0 +1,23 @@
+"""Unit tests for exercise-term corrections."""
+
+import pytest
+
+from workers.nlp.corrections import correct_exercise_terms
+
+
+class TestCorrectExerciseTerms:
+    """Test suite for correct_exercise_terms."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Keep your back STRAIT", "keep your back straight"),
+        ("ten press ups", "ten push-ups"),
+        ("aline your knees and lowwer", "align your knees and lower"),
+        ("no mistakes here", "no mistakes here"),
+        ("Do 10 PUSHUPS then pushup", "do 10 push-ups then push-up"),
+        ("star jumps, star jump", "jumping-jacks, jumping-jacks"),
+        ("squats after squatting", "squats after squatting"),
+        ("plank_hold", "plank_hold"),
+    ])
+    def test_corrections(self, text, expected):
+        """Test mistakes are replaced and text is lowercased."""
+        assert correct_exercise_terms(text) == expected
@@ -12,8 +12,12 @@ from workers.exercise.exercise_classifier import (
     RepPhase,
     PoseData,
     PoseKeypoint,
-    RepMetrics
+    RepMetrics,
+    KEYPOINT_NAMES,
+    KP_INDEX,
+    keypoint_array,
 )
+from workers.exercise.events import KeypointMessage, PoseDataMessage
 
 
 class TestExerciseClassifier:
@@ -78,6 +82,35 @@ class TestExerciseClassifier:
         angle = await classifier._calculate_angle(p1, p2, p3)
         assert abs(angle - 180.0) < 1.0
 
+    @pytest.mark.asyncio
+    async def test_vectorized_angles_match_scalar(self, classifier, mock_pose_data):
+        """Test array-backed angle calculation matches the per-joint path."""
+        array = np.full((len(KEYPOINT_NAMES), 4), np.nan, dtype=np.float32)
+        for name, kp in mock_pose_data.keypoints.items():
+            array[KP_INDEX[name]] = (kp.x, kp.y, kp.z, kp.visibility)
+        array_pose = PoseData.from_array(array, confidence=0.85, timestamp=0.0)
+        
+        scalar_angles = await classifier._calculate_key_angles(mock_pose_data)
+        vector_angles = await classifier._calculate_key_angles(array_pose)
+        
+        assert scalar_angles.keys() == vector_angles.keys()
+        for name, angle in scalar_angles.items():
+            assert abs(vector_angles[name] - angle) < 0.01
+
+    @pytest.mark.asyncio
+    async def test_array_view_missing_keypoints(self, classifier):
+        """Test keypoints absent from the array read as missing."""
+        array = np.full((len(KEYPOINT_NAMES), 4), np.nan, dtype=np.float32)
+        array[KP_INDEX['nose']] = (0.5, 0.3, 0.0, 0.9)
+        pose = PoseData.from_array(array, confidence=0.9, timestamp=0.0)
+        
+        assert list(pose.keypoints) == ['nose']
+        assert pose.keypoints.get('left_knee') is None
+        assert abs(pose.keypoints['nose'].x - 0.5) < 1e-6
+        
+        angles = await classifier._calculate_key_angles(pose)
+        assert all(angle == 180.0 for angle in angles.values())
+
     @pytest.mark.asyncio
     async def test_pushup_position_detection(self, classifier, mock_pose_data):
         """Test push-up position detection."""
@@ -226,6 +259,18 @@ class TestExerciseClassifier:
         assert len(classifier.rep_history) == 0
         assert len(classifier.pose_history) == 0
 
+    @pytest.mark.asyncio
+    async def test_state_version_tracking(self, classifier, mock_pose_data):
+        """Test state version changes on every mutation."""
+        initial_version = classifier.state_version
+
+        await classifier.process_pose(mock_pose_data)
+        after_pose = classifier.state_version
+        assert after_pose > initial_version
+
+        classifier.reset()
+        assert classifier.state_version > after_pose
+
     @pytest.mark.asyncio
     async def test_pose_history_management(self, classifier, mock_pose_data):
         """Test pose history length management."""
@@ -290,6 +335,11 @@ class TestExerciseClassifier:
         assert 0 <= rep_metrics.form_score <= 100
         assert 0 <= rep_metrics.tempo_score <= 100
         assert 0 <= rep_metrics.rom_score <= 100
+        
+        recent = classifier.recent_rep_metrics
+        assert len(recent) == 1
+        assert recent[0]['rep_number'] == 1
+        assert recent[0]['form_score'] == rep_metrics.form_score
 
 
 class TestRepMetrics:
@@ -342,6 +392,21 @@ class TestPoseData:
         assert keypoint.z == 0.1
         assert 0 <= keypoint.visibility <= 1
 
+    def test_keypoint_array_forms(self):
+        """Test rows and the name-keyed form fill the same array."""
+        keypoints = {
+            "left_elbow": KeypointMessage(x=0.35, y=0.6, visibility=0.8),
+            "not_a_landmark": KeypointMessage(x=0.1, y=0.1),
+        }
+        from_dict = keypoint_array(PoseDataMessage(keypoints=keypoints))
+        
+        rows = np.full((len(KEYPOINT_NAMES), 4), np.nan).tolist()
+        rows[KP_INDEX["left_elbow"]] = [0.35, 0.6, 0.0, 0.8]
+        from_rows = keypoint_array(PoseDataMessage(keypoints_xyzv=rows))
+        
+        np.testing.assert_array_equal(from_dict, from_rows)
+        assert np.count_nonzero(~np.isnan(from_dict[:, 0])) == 1
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,55 @@
+"""Unit tests for export request schemas."""
+
+import msgspec
+import pytest
+
+from workers.export.export_service import ExportRequest
+from workers.export.schemas import ExportRequestSchema, request_decoder
+
+
+class TestExportRequestSchema:
+    """Test suite for ExportRequestSchema."""
+
+    def test_decode_defaults(self):
+        """Test missing optional fields take ExportRequest defaults."""
+        msg = request_decoder.decode(
+            b'{"request_id": "r1", "user_id": "u1", "session_ids": ["s1"], "extra": 1}'
+        )
+
+        assert msg.request_id == "r1"
+        assert msg.to_export_request() == ExportRequest(
+            user_id="u1", session_ids=["s1"], format="json", custom_fields=[]
+        )
+
+    @pytest.mark.parametrize("payload", [
+        b'{"session_ids": ["s1"]}',
+        b'{"user_id": "", "session_ids": ["s1"]}',
+        b'{"user_id": "u1", "session_ids": []}',
+        b'{"user_id": "u1", "session_ids": ["s1"], "include_charts": "yes"}',
+    ])
+    def test_decode_rejects_invalid(self, payload):
+        """Test invalid requests fail before an ExportRequest is built."""
+        with pytest.raises(msgspec.ValidationError):
+            request_decoder.decode(payload)
+
+    def test_convert_from_dict(self):
+        """Test HTTP bodies convert with the same rules."""
+        msg = msgspec.convert(
+            {"user_id": "u1", "session_ids": ["s1", "s2"], "format": "csv",
+             "custom_fields": ["exercise_details"], "compression": "zstd"},
+            ExportRequestSchema,
+        )
+        request = msg.to_export_request()
+
+        assert request.format == "csv"
+        assert request.session_ids == ["s1", "s2"]
+        assert request.custom_fields == ["exercise_details"]
+        assert request.compression == "zstd"
+
+    def test_decode_passes_unknown_compression(self):
+        """Test compression is left to service validation, which can reply with an error."""
+        msg = request_decoder.decode(
+            b'{"user_id": "u1", "session_ids": ["s1"], "compression": "gzip"}'
+        )
+
+        assert msg.to_export_request().compression == "gzip"
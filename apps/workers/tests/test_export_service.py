@@ -0,0 +1,257 @@
+"""Unit tests for the workout export service."""
+
+import csv
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from workers.export import export_service
+
+from workers.export.export_service import (
+    REPORTLAB_AVAILABLE,
+    ExportService,
+    ExportRequest,
+    SessionSummary,
+    discard_export_file,
+    generate_export_sync,
+    iter_export_chunks,
+    read_export_data,
+)
+
+
+class TestExportService:
+    """Test suite for ExportService."""
+    
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        """Create a service writing into a temporary directory."""
+        monkeypatch.chdir(tmp_path)
+        return ExportService()
+    
+    def _request(self, format: str = 'json', **kwargs) -> ExportRequest:
+        """Build an export request for three sessions."""
+        return ExportRequest(
+            user_id='user-1',
+            session_ids=['s1', 's2', 's3'],
+            format=format,
+            **kwargs
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_session_data(self, service):
+        """Test mock session data generation."""
+        sessions = await service._fetch_session_data(self._request())
+        
+        assert [s.session_id for s in sessions] == ['s1', 's2', 's3']
+        assert all(isinstance(s, SessionSummary) for s in sessions)
+        
+        second = sessions[1]
+        assert second.total_reps == (16 + 21) * 3
+        assert second.average_form_score == (87 + 85) / 2
+        assert second.duration_minutes == 35.0
+        assert second.calories_burned == 170
+        assert isinstance(second.total_reps, int)
+        assert second.exercises[0]['reps'] == 16
+
+    @pytest.mark.asyncio
+    async def test_fetch_session_data_empty(self, service):
+        """Test no sessions are produced for an empty request."""
+        request = ExportRequest(user_id='user-1', session_ids=[], format='json')
+        assert await service._fetch_session_data(request) == []
+
+    @pytest.mark.asyncio
+    async def test_session_totals(self, service):
+        """Test single-pass totals match per-field aggregation."""
+        sessions = await service._fetch_session_data(self._request())
+        totals = service._session_totals(sessions)
+        
+        assert totals['reps'] == sum(s.total_reps for s in sessions)
+        assert totals['rom_score'] == sum(s.average_rom_score for s in sessions)
+        assert totals['calories'] == sum(s.calories_burned for s in sessions)
+        assert totals['first_start'] == min(s.start_time for s in sessions)
+        assert totals['last_start'] == max(s.start_time for s in sessions)
+
+    @pytest.mark.asyncio
+    async def test_json_export(self, service):
+        """Test JSON export content and summary."""
+        result = await service.generate_export(self._request('json'))
+        
+        assert result['success'] is True
+        assert result['mime_type'] == 'application/json'
+        assert result['sessions_count'] == 3
+        
+        data = json.loads(result['data'])
+        assert data['export_info']['user_id'] == 'user-1'
+        assert len(data['sessions']) == 3
+        assert data['summary']['total_reps'] == sum(s['total_reps'] for s in data['sessions'])
+        assert data['sessions'][0]['start_time'].startswith(data['summary']['date_range']['end'][:10])
+
+    @pytest.mark.asyncio
+    async def test_json_export_stdlib_fallback(self, service, monkeypatch):
+        """Test the stdlib json path produces the same document."""
+        fast = json.loads((await service.generate_export(self._request('json')))['data'])
+        monkeypatch.setattr(export_service, 'ORJSON_AVAILABLE', False)
+        slow = json.loads((await service.generate_export(self._request('json')))['data'])
+        
+        for doc in (fast, slow):
+            del doc['export_info']['generated_at']
+            del doc['summary']['date_range']
+        assert fast['summary'] == slow['summary']
+        assert [s['session_id'] for s in fast['sessions']] == [s['session_id'] for s in slow['sessions']]
+        assert slow['sessions'][0]['exercises'][0]['name'] == 'Push-ups'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('use_arrow', [True, False])
+    async def test_csv_export(self, service, monkeypatch, use_arrow):
+        """Test CSV export rows and exercise detail columns."""
+        if use_arrow and not export_service.PYARROW_AVAILABLE:
+            pytest.skip("pyarrow not installed")
+        monkeypatch.setattr(export_service, 'PYARROW_AVAILABLE', use_arrow)
+        
+        request = self._request('csv', custom_fields=['exercise_details'])
+        result = await service.generate_export(request)
+        
+        assert result['success'] is True
+        rows = list(csv.reader(io.StringIO(result['data'].decode('utf-8'))))
+        assert len(rows) == 4
+        assert rows[0][:2] == ['Session ID', 'Date']
+        assert 'Push-ups Reps' in rows[0]
+        assert rows[1][0] == 's1'
+        assert float(rows[2][rows[0].index('Push-ups Reps')]) == 16 * 3
+        assert float(rows[2][rows[0].index('Avg Form Score')]) == 86.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not export_service.PYARROW_AVAILABLE, reason="pyarrow not installed")
+    async def test_feather_export(self, service):
+        """Test Feather export round-trips the CSV column set."""
+        import pyarrow.feather as feather
+        
+        result = await service.generate_export(self._request('feather', custom_fields=['exercise_details']))
+        
+        assert result['success'] is True
+        assert result['filename'].endswith('.arrow')
+        table = feather.read_table(io.BytesIO(result['data']))
+        assert table.num_rows == 3
+        assert table.column('Session ID').to_pylist() == ['s1', 's2', 's3']
+        assert table.column('Push-ups Reps').to_pylist() == [45, 48, 51]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not export_service.ZSTD_AVAILABLE, reason="zstandard not installed")
+    async def test_compressed_export(self, service):
+        """Test compression='zstd' compresses the export."""
+        import zstandard
+        
+        plain = await service.generate_export(self._request('json'))
+        packed = await service.generate_export(self._request('json', compression='zstd'))
+        
+        assert packed['success'] is True
+        assert packed['filename'].endswith('.json.zst')
+        assert packed['mime_type'] == 'application/json+zstd'
+        assert packed['content_encoding'] == 'zstd'
+        assert packed['file_size'] < plain['file_size']
+        
+        data = json.loads(zstandard.ZstdDecompressor().decompress(packed['data']))
+        assert len(data['sessions']) == 3
+
+    def test_iter_export_chunks(self, tmp_path):
+        """Test chunking in-memory and file-backed exports."""
+        payload = bytes(range(256)) * 10
+        path = tmp_path / 'export.bin'
+        path.write_bytes(payload)
+        
+        in_memory = list(iter_export_chunks({'data': payload}, 1000))
+        on_disk = list(iter_export_chunks({'data': None, 'path': str(path)}, 1000))
+        
+        assert [len(c) for c in in_memory] == [1000, 1000, 560]
+        assert on_disk == in_memory
+        assert b''.join(on_disk) == payload
+
+    @pytest.mark.asyncio
+    async def test_csv_buffer_reuse(self, service):
+        """Test back-to-back CSV builds on one thread don't leak into each other."""
+        now = datetime.now()
+        long_request = self._request('csv', custom_fields=['exercise_details'])
+        sessions = await service._fetch_session_data(long_request)
+        
+        first = service._build_csv(sessions, long_request, now)['data']
+        short = service._build_csv(sessions[:1], self._request('csv'), now)['data']
+        again = service._build_csv(sessions, long_request, now)['data']
+        
+        assert again == first
+        assert len(short) < len(first)
+        assert short.count(b'\n') == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not REPORTLAB_AVAILABLE, reason="ReportLab not installed")
+    async def test_pdf_export(self, service):
+        """Test PDF export is written to disk and read back lazily."""
+        results = [await service.generate_export(self._request('pdf')) for _ in range(2)]
+        
+        # Same user and day share a download name but never a file
+        assert results[0]['filename'] == results[1]['filename']
+        assert results[0]['path'] != results[1]['path']
+        
+        for result in results:
+            assert result['success'] is True
+            assert result['data'] is None
+            assert Path(result['path']).parent == service.output_dir
+            
+            pdf_data = read_export_data(result)
+            assert pdf_data.startswith(b'%PDF')
+            assert result['file_size'] == len(pdf_data)
+            
+            discard_export_file(result)
+            assert not Path(result['path']).exists()
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not REPORTLAB_AVAILABLE, reason="ReportLab not installed")
+    async def test_exercises_section_totals(self, service):
+        """Test per-exercise aggregates in the PDF exercise table."""
+        sessions = await service._fetch_session_data(self._request('pdf'))
+        content = service._create_exercises_section(sessions, export_service._STYLES)
+        rows = content[2]._cellvalues
+        
+        assert rows[1] == ['Push-ups', str((15 + 16 + 17) * 3), '9', '87.0%', '9.5m']
+        assert rows[2][0] == 'Squats'
+        assert rows[2][1] == str((20 + 21 + 22) * 3)
+
+    @pytest.mark.asyncio
+    async def test_generate_exports_batch(self, service):
+        """Test batch exports share one timestamp and keep request order."""
+        requests = [self._request('json'), self._request('csv'), ExportRequest(
+            user_id='user-2', session_ids=[], format='json'
+        )]
+        results = await service.generate_exports_batch(requests)
+        
+        assert [r['success'] for r in results] == [True, True, False]
+        assert results[0]['format'] == 'json'
+        assert results[1]['mime_type'] == 'text/csv'
+        assert results[0]['generated_at'] == results[1]['generated_at']
+        assert results[0]['export_id'] != results[1]['export_id']
+
+    def test_generate_export_in_process_pool(self, service):
+        """Test exports render in a spawned pool process."""
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            result = pool.submit(generate_export_sync, self._request('csv')).result()
+        
+        assert result['success'] is True
+        assert result['sessions_count'] == 3
+        assert b'Session ID' in result['data'].splitlines()[0]
+
+    @pytest.mark.asyncio
+    async def test_validate_export_request(self, service):
+        """Test request validation errors."""
+        valid = await service.validate_export_request(self._request('csv'))
+        assert valid == {'valid': True, 'errors': []}
+        
+        invalid = await service.validate_export_request(
+            ExportRequest(user_id='', session_ids=[], format='xml', template='nope', compression='gzip')
+        )
+        assert invalid['valid'] is False
+        assert len(invalid['errors']) == 5
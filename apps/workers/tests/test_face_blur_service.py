@@ -0,0 +1,108 @@
+"""Unit tests for the face blur service."""
+
+import base64
+
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from workers.privacy.face_blur_service import FaceBlurService, _pad_boxes
+
+
+class TestFaceBlurService:
+    """Test suite for FaceBlurService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create an uninitialized service (mock detection, no executor)."""
+        return FaceBlurService()
+
+    @pytest.fixture
+    def detections(self, service, monkeypatch):
+        """Replace detection with a fixed face and record each call."""
+        calls = []
+
+        def detect(image, gpu_image=None):
+            calls.append(image)
+            return np.array([[10, 10, 20, 20]], dtype=np.int32)
+
+        monkeypatch.setattr(service, '_detect_faces', detect)
+        return calls
+
+    def _frame(self, value: int = 100) -> np.ndarray:
+        """Build a uniform 64x48 RGB frame."""
+        return np.full((48, 64, 3), value, dtype=np.uint8)
+
+    def test_pad_boxes(self):
+        """Test boxes grow on every side and stay inside the frame."""
+        boxes = np.array([[10, 10, 20, 10], [0, 40, 30, 10]], dtype=np.int32)
+
+        padded = _pad_boxes(boxes, 0.1, 64, 48)
+
+        assert padded.tolist() == [[8, 9, 24, 12], [0, 39, 36, 9]]
+        assert padded.dtype == np.int32
+
+    def test_stride_reuses_boxes_per_stream(self, service, detections):
+        """Test detection runs every detect_stride frames of each stream."""
+        frame = self._frame()
+
+        boxes = [service._faces_for_frame(frame, stream_id='a') for _ in range(3)]
+        assert len(detections) == 1
+        assert boxes[0].tolist() == [[10, 10, 20, 20]]
+        assert boxes[1].tolist() == [[8, 8, 24, 24]]  # Reused with padding
+
+        # Another stream keeps its own count and boxes
+        service._faces_for_frame(frame, stream_id='b')
+        assert len(detections) == 2
+
+        service._faces_for_frame(frame, stream_id='a')
+        assert len(detections) == 3
+
+        # Frames of no known stream are always detected
+        service._faces_for_frame(frame)
+        service._faces_for_frame(frame)
+        assert len(detections) == 5
+
+    def test_scene_change_forces_detection(self, service, detections):
+        """Test a changed scene is detected even between strides."""
+        service._faces_for_frame(self._frame(100), stream_id='a')
+        service._faces_for_frame(self._frame(200), stream_id='a')
+
+        assert len(detections) == 2
+
+    def test_passthrough_frame(self, service):
+        """Test clean JPEG input is echoed back in the requested form."""
+        jpeg = b"\xff\xd8\xff\xe0" + b"\x00" * 16
+        encoded = base64.b64encode(jpeg).decode('ascii')
+        data_url = f"data:image/jpeg;base64,{encoded}"
+
+        assert service._passthrough_frame({'image_data': encoded}) == {'blurred_frame': data_url}
+        assert service._passthrough_frame({'image_data': data_url}) == {'blurred_frame': data_url}
+        assert service._passthrough_frame({'image_data': memoryview(jpeg)}) == {'blurred_frame': data_url}
+
+        raw = FaceBlurService(encode_base64=False)
+        assert raw._passthrough_frame({'image_data': data_url}) == {
+            'blurred_frame_bytes': jpeg,
+            'mime': 'image/jpeg'
+        }
+
+        # Anything that isn't a JPEG must be re-encoded
+        png = base64.b64encode(b"\x89PNG\r\n\x1a\n").decode('ascii')
+        assert service._passthrough_frame({'image_data': png}) is None
+        assert service._passthrough_frame({'width': 1, 'height': 1, 'data': b"abc"}) is None
+
+    def test_blur_read_only_raw_frame(self, service):
+        """Test raw bytes decode without a copy and blur into a new buffer."""
+        rng = np.random.default_rng(0)
+        data = rng.integers(0, 256, 64 * 48 * 3, dtype=np.uint8).tobytes()
+
+        image = service._decode_frame({'width': 64, 'height': 48, 'data': data})
+        assert not image.flags.writeable
+
+        out = service._blur_faces(image, np.array([[8, 8, 32, 32]], dtype=np.int32))
+
+        assert out is not image
+        assert out.flags.writeable
+        assert not np.array_equal(out[8:40, 8:40], image[8:40, 8:40])
+        assert np.array_equal(out[:8], image[:8])
@@ -0,0 +1,85 @@
+"""Unit tests for the fused pose frame processor."""
+
+import pytest
+import msgspec
+
+from workers.exercise.exercise_classifier import ExerciseClassifier
+from workers.exercise.frame_processor import FrameProcessor
+
+
+class TestFrameProcessor:
+    """Test suite for FrameProcessor."""
+    
+    @pytest.fixture
+    def processor(self):
+        """Create a processor around a fresh classifier."""
+        return FrameProcessor(ExerciseClassifier())
+    
+    def _frame(self, shift: float = 0.0) -> bytes:
+        """Encode a pose.result message like the pose worker publishes."""
+        return msgspec.json.encode({
+            "session_id": "session-1",
+            "timestamp": 12.5,
+            "worker": "pose-detector",
+            "pose_data": {
+                "keypoints": {
+                    "left_shoulder": {"x": 0.4 + shift, "y": 0.45, "z": 0.0, "visibility": 0.9},
+                    "left_elbow": {"x": 0.35 + shift, "y": 0.6, "z": 0.0, "visibility": 0.8},
+                    "left_wrist": {"x": 0.3 + shift, "y": 0.75, "z": 0.0, "visibility": 0.7},
+                },
+                "confidence": 0.9,
+                "landmarks_detected": True,
+            },
+        })
+
+    @pytest.mark.asyncio
+    async def test_publishes_analysis(self, processor):
+        """Test a new frame produces an analysis message."""
+        out = await processor.process(self._frame())
+        
+        subjects = [subject for subject, _ in out]
+        assert subjects[0] == "exercise.analysis"
+        
+        analysis = msgspec.json.decode(out[0][1])
+        assert analysis["session_id"] == "session-1"
+        assert analysis["timestamp"] == 12.5
+        assert "left_elbow" in analysis["metrics"]["angles"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_frame_sends_heartbeat(self, processor):
+        """Test a repeated frame skips the classifier."""
+        await processor.process(self._frame())
+        version = processor.classifier.state_version
+        
+        out = await processor.process(self._frame())
+        
+        assert [subject for subject, _ in out] == ["exercise.heartbeat"]
+        assert processor.classifier.state_version == version
+        
+        out = await processor.process(self._frame(shift=0.1))
+        assert out[0][0] == "exercise.analysis"
+
+    @pytest.mark.asyncio
+    async def test_missing_pose_data(self, processor):
+        """Test frames without pose data publish nothing."""
+        raw = msgspec.json.encode({"session_id": "session-1", "pose_data": None})
+        assert await processor.process(raw) == []
+
+    @pytest.mark.asyncio
+    async def test_keypoint_rows(self, processor):
+        """Test keypoints_xyzv rows give the same angles as the dict form."""
+        legacy = msgspec.json.decode((await processor.process(self._frame()))[0][1])
+        
+        rows = [[0.0] * 4 for _ in range(33)]
+        rows[11] = [0.4, 0.45, 0.0, 0.9]
+        rows[13] = [0.35, 0.6, 0.0, 0.8]
+        rows[15] = [0.3, 0.75, 0.0, 0.7]
+        raw = msgspec.json.encode({
+            "session_id": "session-1",
+            "timestamp": 12.5,
+            "pose_data": {"keypoints_xyzv": rows, "confidence": 0.9},
+        })
+        
+        out = await FrameProcessor(ExerciseClassifier()).process(raw)
+        analysis = msgspec.json.decode(out[0][1])
+        assert analysis["metrics"]["angles"]["left_elbow"] == legacy["metrics"]["angles"]["left_elbow"]
@@ -0,0 +1,119 @@
+"""Unit tests for the rule-based NLP intent parser."""
+
+import re
+
+import pytest
+
+from workers.nlp.intent_parser import IntentParser, IntentType
+
+
+class TestIntentParser:
+    """Test suite for IntentParser."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create a fresh intent parser for each test."""
+        return IntentParser()
+
+    def test_patterns_precompiled(self, parser):
+        """Test intent and entity patterns are compiled at construction."""
+        for patterns in parser.patterns.values():
+            assert all(isinstance(p, re.Pattern) for p in patterns)
+        for patterns in parser.entities_patterns.values():
+            assert all(isinstance(p, re.Pattern) for p in patterns)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text,expected", [
+        ("pause", IntentType.PAUSE),
+        ("Take a   BREAK", IntentType.PAUSE),
+        ("keep going", IntentType.RESUME),
+        ("end workout", IntentType.STOP),
+        ("next exercise", IntentType.NEXT),
+        ("one more time", IntentType.REPEAT),
+        ("make it easier", IntentType.EASIER),
+        ("too easy", IntentType.HARDER),
+        ("check my form", IntentType.FORM_CHECK),
+        ("how many reps", IntentType.REP_COUNT),
+        ("what can you do", IntentType.HELP),
+        ("I want to do lunges", IntentType.EXERCISE_SELECT),
+        ("start squats", IntentType.EXERCISE_SELECT),
+        ("hmm", IntentType.UNKNOWN),
+    ])
+    async def test_intent_matching(self, parser, text, expected):
+        """Test utterances map to the expected intent."""
+        intent = await parser.parse_intent(text, timestamp=1.0)
+
+        assert intent.type == expected
+        assert intent.original_text == text
+        if expected == IntentType.UNKNOWN:
+            assert intent.confidence == 0.0
+        else:
+            assert 0.7 <= intent.confidence <= 0.95
+
+    def test_normalize_text(self, parser):
+        """Test lowercasing, whitespace collapse and contraction expansion."""
+        assert parser._normalize_text("  I'm   DONE, Let's stop ") == "i am done, let us stop"
+        assert parser._normalize_text("don't   won't can't") == "do not will not cannot"
+
+    def test_master_pattern_groups(self, parser):
+        """Test the fused pattern names its groups after intents."""
+        match = parser._master_intent_re.search("check my form please")
+        assert IntentType[match.lastgroup] == IntentType.FORM_CHECK
+        assert parser._master_intent_re.search("hmm") is None
+
+    def test_literal_fast_path_matches_scan(self, parser):
+        """Test one-word lookups agree with the full pattern scan."""
+        for word, result in parser._literal_intents.items():
+            assert parser._match_intent(word) == result
+            assert parser._scan_intent_patterns(word) == result
+        assert parser._literal_intents['help'][0] == IntentType.HELP
+
+    @pytest.mark.asyncio
+    async def test_entity_extraction(self, parser):
+        """Test exercise, number and duration entities are normalized."""
+        intent = await parser.parse_intent("start planks for five minutes, then 10 push ups")
+
+        exercises = [e['value'] for e in intent.entities['exercise']]
+        numbers = [e['value'] for e in intent.entities['number']]
+
+        assert exercises == ['planks', 'push-ups']
+        assert numbers == [5, 10]
+        assert 'duration' not in intent.entities
+
+    @pytest.mark.asyncio
+    async def test_parse_cache(self, parser):
+        """Test repeated utterances hit the cache and return independent entities."""
+        first = await parser.parse_intent("Do 10 push ups", timestamp=1.0)
+        first.entities['number'][0]['value'] = 99
+        second = await parser.parse_intent("do 10  push ups", timestamp=2.0)
+
+        assert parser._parse_cached.cache_info().hits == 1
+        assert second.timestamp == 2.0
+        assert second.original_text == "do 10  push ups"
+        assert second.entities['number'][0]['value'] == 10
+
+    @pytest.mark.asyncio
+    async def test_duration_entity(self, parser):
+        """Test numeric durations are captured with their unit."""
+        intent = await parser.parse_intent("hold for 30 seconds")
+
+        duration = intent.entities['duration'][0]
+        assert duration['value'] == '30'
+        assert duration['text'] == '30 seconds'
+
+    @pytest.mark.asyncio
+    async def test_generate_response(self, parser):
+        """Test dynamic responses are filled per call without touching the table."""
+        intent = await parser.parse_intent("how many reps", timestamp=3.0)
+
+        first = await parser.generate_response(intent, {"rep_count": 12})
+        second = await parser.generate_response(intent)
+
+        assert first['action'] == 'provide_rep_count'
+        assert first['message'] == "You've completed 12 reps."
+        assert second['tts'] == 'You have done 0 reps.'
+        assert second['timestamp'] == 3.0
+
+        unknown = await parser.generate_response(await parser.parse_intent("hmm"))
+        assert unknown['action'] == 'unknown_command'
+        assert unknown['intent'] == IntentType.UNKNOWN.value
@@ -0,0 +1,62 @@
+"""Typed NATS message payloads for the exercise worker."""
+
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class KeypointMessage(msgspec.Struct):
+    """Single landmark as published by the pose worker."""
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    visibility: float = 1.0
+
+
+class PoseDataMessage(msgspec.Struct):
+    """``pose_data`` block of a ``pose.result`` message.
+    
+    Current pose workers send ``keypoints_xyzv`` rows in ``KEYPOINT_NAMES``
+    order; ``keypoints`` is the legacy name-keyed form.
+    """
+    keypoints_xyzv: Optional[List[List[float]]] = None
+    keypoints: Dict[str, KeypointMessage] = {}
+    confidence: float = 0.0
+
+
+class PoseResultMessage(msgspec.Struct):
+    """Inbound ``pose.result`` message; unknown fields are ignored."""
+    session_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    pose_data: Optional[PoseDataMessage] = None
+
+
+class HeartbeatEvent(msgspec.Struct):
+    """Published on ``exercise.heartbeat`` for frames skipped as duplicates."""
+    session_id: Optional[str]
+    timestamp: float
+    worker: str = "exercise-classifier"
+
+
+class RepEvent(msgspec.Struct):
+    """Published on ``exercise.rep_completed`` when a rep finishes."""
+    session_id: Optional[str]
+    exercise_type: Optional[str]
+    rep_count: int
+    metrics: Dict[str, Any]
+    timestamp: float
+    worker: str = "exercise-classifier"
+
+
+class FeedbackEvent(msgspec.Struct):
+    """Published on ``coaching.feedback`` when form feedback is available."""
+    session_id: Optional[str]
+    exercise_type: Optional[str]
+    feedback: List[str]
+    timestamp: float
+    priority: str = "form"
+    worker: str = "exercise-classifier"
+
+
+# Shared encoder; msgspec encoders are reusable and keep an internal buffer
+event_encoder = msgspec.json.Encoder()
@@ -2,12 +2,16 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from collections import deque
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
 from datetime import datetime, timedelta
 
+from .events import PoseDataMessage
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +36,35 @@ class RepPhase(Enum):
     COMPLETED = "completed"
 
 
+# MediaPipe pose landmark order; rows of PoseData.array follow this layout
+KEYPOINT_NAMES: Tuple[str, ...] = (
+    "nose", "left_eye_inner", "left_eye", "left_eye_outer",
+    "right_eye_inner", "right_eye", "right_eye_outer",
+    "left_ear", "right_ear", "mouth_left", "mouth_right",
+    "left_shoulder", "right_shoulder", "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist", "left_pinky", "right_pinky",
+    "left_index", "right_index", "left_thumb", "right_thumb",
+    "left_hip", "right_hip", "left_knee", "right_knee",
+    "left_ankle", "right_ankle", "left_heel", "right_heel",
+    "left_foot_index", "right_foot_index",
+)
+KP_INDEX: Dict[str, int] = {name: i for i, name in enumerate(KEYPOINT_NAMES)}
+
+# Joint angle -> (first point, vertex, last point)
+ANGLE_JOINTS: Dict[str, Tuple[str, str, str]] = {
+    'left_elbow': ('left_shoulder', 'left_elbow', 'left_wrist'),
+    'right_elbow': ('right_shoulder', 'right_elbow', 'right_wrist'),
+    'left_knee': ('left_hip', 'left_knee', 'left_ankle'),
+    'right_knee': ('right_hip', 'right_knee', 'right_ankle'),
+    'left_hip': ('left_shoulder', 'left_hip', 'left_knee'),
+    'right_hip': ('right_shoulder', 'right_hip', 'right_knee'),
+}
+_ANGLE_NAMES = tuple(ANGLE_JOINTS)
+_ANGLE_A = np.array([KP_INDEX[a] for a, _, _ in ANGLE_JOINTS.values()])
+_ANGLE_B = np.array([KP_INDEX[b] for _, b, _ in ANGLE_JOINTS.values()])
+_ANGLE_C = np.array([KP_INDEX[c] for _, _, c in ANGLE_JOINTS.values()])
+
+
 @dataclass
 class PoseKeypoint:
     """3D pose keypoint."""
@@ -41,12 +74,67 @@ class PoseKeypoint:
     visibility: float = 1.0
 
 
+class KeypointArrayView(Mapping):
+    """Read-only name -> PoseKeypoint mapping backed by a keypoint array.
+    
+    Rows whose x coordinate is NaN are treated as missing. PoseKeypoint
+    objects are only created for the keypoints that are actually read.
+    """
+    
+    def __init__(self, array: np.ndarray):
+        self._array = array
+    
+    def __getitem__(self, name: str) -> PoseKeypoint:
+        row = self._array[KP_INDEX[name]]
+        if np.isnan(row[0]):
+            raise KeyError(name)
+        x, y, z, visibility = row.tolist()
+        return PoseKeypoint(x=x, y=y, z=z, visibility=visibility)
+    
+    def __iter__(self) -> Iterator[str]:
+        present = ~np.isnan(self._array[:, 0])
+        return (KEYPOINT_NAMES[i] for i in np.flatnonzero(present))
+    
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self._array[:, 0])))
+
+
 @dataclass
 class PoseData:
     """Complete pose data structure."""
     keypoints: Dict[str, PoseKeypoint]
     confidence: float
     timestamp: float
+    array: Optional[np.ndarray] = None  # (len(KEYPOINT_NAMES), 4) x, y, z, visibility
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, confidence: float, timestamp: float) -> "PoseData":
+        """Build pose data from a keypoint array laid out as KEYPOINT_NAMES."""
+        return cls(
+            keypoints=KeypointArrayView(array),
+            confidence=confidence,
+            timestamp=timestamp,
+            array=array,
+        )
+
+
+def keypoint_array(pose: PoseDataMessage) -> np.ndarray:
+    """Fill a fresh KEYPOINT_NAMES-ordered array from a pose message.
+    
+    ``keypoints_xyzv`` rows are used when present, otherwise the legacy
+    name-keyed ``keypoints``; missing landmarks stay NaN and unknown names
+    are dropped.
+    """
+    array = np.full((len(KEYPOINT_NAMES), 4), np.nan, dtype=np.float32)
+    if pose.keypoints_xyzv:
+        rows = np.asarray(pose.keypoints_xyzv, dtype=np.float32)[:len(KEYPOINT_NAMES)]
+        array[:len(rows)] = rows
+    else:
+        for name, kp in pose.keypoints.items():
+            i = KP_INDEX.get(name)
+            if i is not None:
+                array[i] = (kp.x, kp.y, kp.z, kp.visibility)
+    return array
 
 
 @dataclass
@@ -74,6 +162,12 @@ class ExerciseClassifier:
         self.phase_start_time: Optional[float] = None
         self.rep_start_time: Optional[float] = None
         
+        # Serialized summaries of the last few reps, kept for the stats endpoint
+        self._recent_serialized: deque = deque(maxlen=5)
+        
+        # Bumped on every state mutation so readers can cache derived views
+        self._state_version = 0
+        
         # Thresholds and parameters
         self.confidence_threshold = 0.7
         self.min_rep_duration = 1.0  # seconds
@@ -100,9 +194,21 @@ class ExerciseClassifier:
             },
         }
 
+    @property
+    def state_version(self) -> int:
+        """Monotonic counter that changes whenever classifier state changes."""
+        return self._state_version
+
+    @property
+    def recent_rep_metrics(self) -> List[Dict[str, Any]]:
+        """Summaries of the most recent reps, oldest first."""
+        return list(self._recent_serialized)
+
     async def process_pose(self, pose_data: PoseData) -> Dict[str, Any]:
         """Process new pose data and update exercise state."""
         try:
+            self._state_version += 1
+            
             # Add to history
             self.pose_history.append(pose_data)
             if len(self.pose_history) > self.history_length:
@@ -376,51 +482,47 @@ class ExerciseClassifier:
 
     async def _calculate_key_angles(self, pose_data: PoseData) -> Dict[str, float]:
         """Calculate key joint angles for the current exercise."""
+        if pose_data.array is not None:
+            return self._calculate_key_angles_vectorized(pose_data.array)
+        
         keypoints = pose_data.keypoints
         angles = {}
         
         try:
-            # Calculate elbow angles
-            angles['left_elbow'] = await self._calculate_angle(
-                keypoints.get('left_shoulder'),
-                keypoints.get('left_elbow'),
-                keypoints.get('left_wrist')
-            )
-            angles['right_elbow'] = await self._calculate_angle(
-                keypoints.get('right_shoulder'),
-                keypoints.get('right_elbow'),
-                keypoints.get('right_wrist')
-            )
-            
-            # Calculate knee angles
-            angles['left_knee'] = await self._calculate_angle(
-                keypoints.get('left_hip'),
-                keypoints.get('left_knee'),
-                keypoints.get('left_ankle')
-            )
-            angles['right_knee'] = await self._calculate_angle(
-                keypoints.get('right_hip'),
-                keypoints.get('right_knee'),
-                keypoints.get('right_ankle')
-            )
-            
-            # Calculate hip angles
-            angles['left_hip'] = await self._calculate_angle(
-                keypoints.get('left_shoulder'),
-                keypoints.get('left_hip'),
-                keypoints.get('left_knee')
-            )
-            angles['right_hip'] = await self._calculate_angle(
-                keypoints.get('right_shoulder'),
-                keypoints.get('right_hip'),
-                keypoints.get('right_knee')
-            )
+            for angle_name, (a, b, c) in ANGLE_JOINTS.items():
+                angles[angle_name] = await self._calculate_angle(
+                    keypoints.get(a),
+                    keypoints.get(b),
+                    keypoints.get(c)
+                )
             
         except Exception as e:
             logger.error(f"Error calculating angles: {e}")
         
         return angles
 
+    def _calculate_key_angles_vectorized(self, array: np.ndarray) -> Dict[str, float]:
+        """Calculate all key joint angles in one pass over a keypoint array."""
+        # arccos is ill-conditioned near 180 degrees, so work in float64
+        points = array[:, :2].astype(np.float64)
+        a = points[_ANGLE_A]
+        b = points[_ANGLE_B]
+        c = points[_ANGLE_C]
+        ba = a - b
+        bc = c - b
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cosine = np.einsum('ij,ij->i', ba, bc) / (
+                np.linalg.norm(ba, axis=1) * np.linalg.norm(bc, axis=1)
+            )
+            degrees = np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+        
+        # Missing keypoints default to a straight angle, as in _calculate_angle
+        missing = np.isnan(a[:, 0]) | np.isnan(b[:, 0]) | np.isnan(c[:, 0])
+        degrees[missing] = 180.0
+        
+        return dict(zip(_ANGLE_NAMES, degrees.tolist()))
+
     async def _calculate_angle(self, p1: Optional[PoseKeypoint], 
                              p2: Optional[PoseKeypoint], 
                              p3: Optional[PoseKeypoint]) -> float:
@@ -470,6 +572,13 @@ class ExerciseClassifier:
         )
         
         self.rep_history.append(metrics)
+        self._recent_serialized.append({
+            "rep_number": metrics.rep_number,
+            "duration": metrics.duration,
+            "form_score": metrics.form_score,
+            "tempo_score": metrics.tempo_score,
+            "rom_score": metrics.rom_score,
+        })
         
         # Reset for next rep
         self.current_phase = RepPhase.REST
@@ -559,5 +668,7 @@ class ExerciseClassifier:
         self.rep_count = 0
         self.rep_history.clear()
         self.pose_history.clear()
+        self._recent_serialized.clear()
         self.phase_start_time = None
         self.rep_start_time = None
+        self._state_version += 1
@@ -0,0 +1,94 @@
+"""Single-pass processing of raw pose.result frames."""
+
+import logging
+from collections import deque
+from typing import List, Tuple
+
+import msgspec
+import numpy as np
+
+from .events import (
+    FeedbackEvent,
+    HeartbeatEvent,
+    PoseResultMessage,
+    RepEvent,
+    event_encoder,
+)
+from .exercise_classifier import ExerciseClassifier, PoseData, keypoint_array
+
+logger = logging.getLogger(__name__)
+
+# Frames whose quantized keypoints match one of the last few are skipped
+FRAME_DEDUP_WINDOW = 3
+FRAME_QUANTIZATION = 128
+
+
+class FrameProcessor:
+    """Decode, classify and encode a pose frame in one pass.
+    
+    Takes the raw NATS payload and returns the ``(subject, payload)`` pairs to
+    publish, so no intermediate dicts are built between decode and encode.
+    """
+    
+    def __init__(self, classifier: ExerciseClassifier):
+        self.classifier = classifier
+        self.decoder = msgspec.json.Decoder(PoseResultMessage)
+        self.encoder = event_encoder
+        self._recent_frames: deque = deque(maxlen=FRAME_DEDUP_WINDOW)
+    
+    async def process(self, raw: bytes) -> List[Tuple[str, bytes]]:
+        """Process one encoded pose.result message."""
+        msg = self.decoder.decode(raw)
+        pose = msg.pose_data
+        if pose is None:
+            logger.warning("No pose data in message")
+            return []
+        
+        session_id = msg.session_id
+        timestamp = msg.timestamp or 0.0
+        
+        # A fresh array per frame; PoseData in the classifier history keeps a reference
+        array = keypoint_array(pose)
+        
+        # Skip classifier work when the subject is holding still
+        fingerprint = hash(np.rint(array[:, :2] * FRAME_QUANTIZATION).tobytes())
+        if fingerprint in self._recent_frames:
+            heartbeat = HeartbeatEvent(session_id=session_id, timestamp=timestamp)
+            return [("exercise.heartbeat", self.encoder.encode(heartbeat))]
+        self._recent_frames.append(fingerprint)
+        
+        # The rep FSM and pose history must see every frame in order, so this
+        # stays in-process rather than being fanned out to a process pool.
+        result = await self.classifier.process_pose(
+            PoseData.from_array(array, confidence=pose.confidence, timestamp=timestamp)
+        )
+        result["session_id"] = session_id
+        result["worker"] = "exercise-classifier"
+        
+        out = [("exercise.analysis", self.encoder.encode(result))]
+        
+        if result.get("rep_completed"):
+            rep_event = RepEvent(
+                session_id=session_id,
+                exercise_type=result.get("exercise_type"),
+                rep_count=result.get("rep_count"),
+                metrics=result.get("metrics"),
+                timestamp=timestamp,
+            )
+            out.append(("exercise.rep_completed", self.encoder.encode(rep_event)))
+        
+        form_feedback = result.get("form_feedback")
+        if form_feedback:
+            feedback_event = FeedbackEvent(
+                session_id=session_id,
+                exercise_type=result.get("exercise_type"),
+                feedback=form_feedback,
+                timestamp=timestamp,
+            )
+            out.append(("coaching.feedback", self.encoder.encode(feedback_event)))
+        
+        return out
+    
+    def reset(self) -> None:
+        """Forget recent frame fingerprints."""
+        self._recent_frames.clear()
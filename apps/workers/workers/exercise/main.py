@@ -2,64 +2,51 @@
 
 import asyncio
 import logging
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, Tuple
 
+import msgspec
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from ..shared.config import get_settings
 from ..shared.nats_client import NATSClient
-from .exercise_classifier import ExerciseClassifier, PoseData, PoseKeypoint
+from .events import PoseDataMessage
+from .exercise_classifier import ExerciseClassifier, PoseData, keypoint_array
+from .frame_processor import FrameProcessor
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="Exercise Classification Worker",
-    description="Exercise detection, rep counting, and form analysis",
-    version="1.0.0",
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Global instances
-exercise_classifier: ExerciseClassifier = None
-nats_client: NATSClient = None
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup."""
-    global exercise_classifier, nats_client
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and clean them up on shutdown."""
+    global exercise_classifier, frame_processor, nats_client
     
     settings = get_settings()
     
     # Initialize exercise classifier
     exercise_classifier = ExerciseClassifier()
+    frame_processor = FrameProcessor(exercise_classifier)
     
     # Initialize NATS client
     nats_client = NATSClient(settings.nats_url)
     await nats_client.connect()
     
-    # Subscribe to pose results from pose detection worker
-    await nats_client.subscribe("pose.result", handle_pose_result)
+    # Subscribe to pose results from pose detection worker. No queue group:
+    # rep counting keeps per-session state, so every frame of a session must
+    # reach the same process rather than being split across replicas
+    await nats_client.subscribe("pose.result", handle_pose_result, raw=True)
     
-    # Subscribe to exercise control commands
+    # Control commands (e.g. reset) are broadcast so every replica sees them
     await nats_client.subscribe("exercise.control", handle_exercise_control)
     
     logger.info("Exercise classification worker started")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    global nats_client
+    
+    yield
     
     if nats_client:
         await nats_client.disconnect()
@@ -67,58 +54,40 @@ async def shutdown_event():
     logger.info("Exercise classification worker stopped")
 
 
-async def handle_pose_result(msg: Dict[str, Any]) -> None:
+app = FastAPI(
+    title="Exercise Classification Worker",
+    description="Exercise detection, rep counting, and form analysis",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=get_settings().cors_origins,
+    allow_credentials=False,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Global instances
+exercise_classifier: ExerciseClassifier = None
+frame_processor: FrameProcessor = None
+nats_client: NATSClient = None
+
+# Cached endpoint payloads keyed on the classifier state version
+_health_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+_stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+
+async def handle_pose_result(raw: bytes) -> None:
     """Handle pose detection results from pose worker."""
     try:
-        # Extract pose data from message
-        pose_data_dict = msg.get("pose_data")
-        session_id = msg.get("session_id")
-        timestamp = msg.get("timestamp", 0)
-        
-        if not pose_data_dict:
-            logger.warning("No pose data in message")
-            return
-        
-        # Convert to PoseData object
-        pose_data = await convert_pose_data(pose_data_dict, timestamp)
-        
-        # Process with exercise classifier
-        result = await exercise_classifier.process_pose(pose_data)
-        
-        # Add session context
-        result["session_id"] = session_id
-        result["worker"] = "exercise-classifier"
-        
-        # Publish exercise analysis results
-        await nats_client.publish("exercise.analysis", result)
-        
-        # If rep completed, publish rep event
-        if result.get("rep_completed"):
-            rep_event = {
-                "session_id": session_id,
-                "exercise_type": result.get("exercise_type"),
-                "rep_count": result.get("rep_count"),
-                "metrics": result.get("metrics"),
-                "timestamp": timestamp,
-                "worker": "exercise-classifier"
-            }
-            await nats_client.publish("exercise.rep_completed", rep_event)
-        
-        # Publish form feedback if available
-        form_feedback = result.get("form_feedback", [])
-        if form_feedback:
-            feedback_event = {
-                "session_id": session_id,
-                "exercise_type": result.get("exercise_type"),
-                "feedback": form_feedback,
-                "priority": "form",
-                "timestamp": timestamp,
-                "worker": "exercise-classifier"
-            }
-            await nats_client.publish("coaching.feedback", feedback_event)
-        
+        for subject, payload in await frame_processor.process(raw):
+            await nats_client.publish(subject, payload)
     except Exception as e:
-        logger.error(f"Error processing pose result: {e}")
+        logger.error("Error processing pose result: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
 async def handle_exercise_control(msg: Dict[str, Any]) -> None:
@@ -129,12 +98,13 @@ async def handle_exercise_control(msg: Dict[str, Any]) -> None:
         
         if command == "reset":
             exercise_classifier.reset()
-            logger.info(f"Reset exercise classifier for session {session_id}")
+            frame_processor.reset()
+            logger.info("Reset exercise classifier for session %s", session_id)
         
         elif command == "set_exercise":
             exercise_type = msg.get("exercise_type")
             # TODO: Implement manual exercise type setting
-            logger.info(f"Set exercise type to {exercise_type} for session {session_id}")
+            logger.info("Set exercise type to %s for session %s", exercise_type, session_id)
         
         # Acknowledge command
         response = {
@@ -147,34 +117,34 @@ async def handle_exercise_control(msg: Dict[str, Any]) -> None:
         await nats_client.publish("exercise.control_response", response)
         
     except Exception as e:
-        logger.error(f"Error handling exercise control: {e}")
+        logger.error("Error handling exercise control: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
 
 
-async def convert_pose_data(pose_data_dict: Dict[str, Any], timestamp: float) -> PoseData:
-    """Convert pose data dictionary to PoseData object."""
-    keypoints = {}
-    
-    # Convert keypoints
-    keypoints_dict = pose_data_dict.get("keypoints", {})
-    for name, point_data in keypoints_dict.items():
-        keypoints[name] = PoseKeypoint(
-            x=point_data.get("x", 0.0),
-            y=point_data.get("y", 0.0),
-            z=point_data.get("z", 0.0),
-            visibility=point_data.get("visibility", 1.0)
-        )
-    
-    return PoseData(
-        keypoints=keypoints,
-        confidence=pose_data_dict.get("confidence", 0.0),
-        timestamp=timestamp
-    )
+def convert_pose_data(pose_data_dict: Dict[str, Any], timestamp: float) -> PoseData:
+    """Convert pose data dictionary to PoseData backed by a keypoint array."""
+    # Same message type and array fill as pose.result frames
+    pose = msgspec.convert(pose_data_dict, PoseDataMessage)
+    return PoseData.from_array(keypoint_array(pose), confidence=pose.confidence, timestamp=timestamp)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
+    global _health_cache
+    
+    if not exercise_classifier:
+        return {
+            "status": "healthy",
+            "service": "exercise-classification-worker",
+            "version": "1.0.0",
+            "classifier_state": None
+        }
+    
+    version = exercise_classifier.state_version
+    if _health_cache and _health_cache[0] == version:
+        return _health_cache[1]
+    
+    payload = {
         "status": "healthy",
         "service": "exercise-classification-worker",
         "version": "1.0.0",
@@ -182,8 +152,10 @@ async def health_check():
             "current_exercise": exercise_classifier.current_exercise.value if exercise_classifier.current_exercise else None,
             "rep_count": exercise_classifier.rep_count,
             "current_phase": exercise_classifier.current_phase.value,
-        } if exercise_classifier else None
+        }
     }
+    _health_cache = (version, payload)
+    return payload
 
 
 @app.post("/analyze")
@@ -192,14 +164,14 @@ async def analyze_pose_endpoint(pose_data: Dict[str, Any]):
     try:
         # Convert input to PoseData
         timestamp = pose_data.get("timestamp", 0)
-        pose_obj = await convert_pose_data(pose_data, timestamp)
+        pose_obj = convert_pose_data(pose_data, timestamp)
         
         # Process with classifier
         result = await exercise_classifier.process_pose(pose_obj)
         
         return {"success": True, "analysis": result}
     except Exception as e:
-        logger.error(f"Error in analyze endpoint: {e}")
+        logger.error("Error in analyze endpoint: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
 
 
@@ -208,17 +180,24 @@ async def reset_classifier_endpoint():
     """HTTP endpoint to reset classifier state."""
     try:
         exercise_classifier.reset()
+        frame_processor.reset()
         return {"success": True, "message": "Classifier reset"}
     except Exception as e:
-        logger.error(f"Error resetting classifier: {e}")
+        logger.error("Error resetting classifier: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
 
 
 @app.get("/stats")
 async def get_stats_endpoint():
     """Get classifier statistics."""
+    global _stats_cache
+    
     try:
-        return {
+        version = exercise_classifier.state_version
+        if _stats_cache and _stats_cache[0] == version:
+            return _stats_cache[1]
+        
+        payload = {
             "success": True,
             "stats": {
                 "current_exercise": exercise_classifier.current_exercise.value if exercise_classifier.current_exercise else None,
@@ -226,20 +205,13 @@ async def get_stats_endpoint():
                 "current_phase": exercise_classifier.current_phase.value,
                 "total_reps_history": len(exercise_classifier.rep_history),
                 "pose_history_length": len(exercise_classifier.pose_history),
-                "recent_rep_metrics": [
-                    {
-                        "rep_number": rep.rep_number,
-                        "duration": rep.duration,
-                        "form_score": rep.form_score,
-                        "tempo_score": rep.tempo_score,
-                        "rom_score": rep.rom_score,
-                    }
-                    for rep in exercise_classifier.rep_history[-5:]  # Last 5 reps
-                ]
+                "recent_rep_metrics": exercise_classifier.recent_rep_metrics,
             }
         }
+        _stats_cache = (version, payload)
+        return payload
     except Exception as e:
-        logger.error(f"Error getting stats: {e}")
+        logger.error("Error getting stats: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return {"success": False, "error": str(e)}
 
 
@@ -250,6 +222,8 @@ def main():
         "workers.exercise.main:app",
         host="0.0.0.0",
         port=settings.exercise_worker_port,
+        loop="uvloop",
+        http="httptools",
         reload=settings.debug,
         log_level="info" if not settings.debug else "debug",
     )
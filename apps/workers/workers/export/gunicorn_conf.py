@@ -0,0 +1,22 @@
+"""Gunicorn settings for the export worker.
+
+Export generation is CPU-bound (ReportLab, Arrow, zstd), so production
+serves it from several Uvicorn processes instead of one event loop.
+
+Each worker also owns an export process pool (see EXPORT_POOL_SIZE in
+main.py), so a host runs ``workers * EXPORT_POOL_SIZE`` render processes.
+Rendering happens in those pools, so the default is one worker per core and
+the pools split the cores between them.
+"""
+
+import multiprocessing
+import os
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = 1000
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+# Workers inherit the master's environment, so publishing the resolved count
+# lets main.py size each pool as its share of the cores
+os.environ["WEB_CONCURRENCY"] = str(workers)
@@ -2,20 +2,52 @@
 
 import asyncio
 import logging
-from typing import Dict, Any
-import base64
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, Response
+from starlette.background import BackgroundTask
+import msgspec
 import uvicorn
 
 from ..shared.config import get_settings
-from ..shared.nats_client import NATSClient
-from .export_service import ExportService, ExportRequest
+from ..shared.nats_client import NATSClient, encode_message
+from .export_service import (
+    EXPORT_FORMATS,
+    TEMPLATE_NAMES,
+    ExportService,
+    ExportRequest,
+    discard_export_file,
+    generate_export_sync,
+    iter_export_chunks,
+)
+from .schemas import ExportRequestSchema, request_decoder
 
 logger = logging.getLogger(__name__)
 
+# Export files stream as raw binary chunks on export.data.<request_id>;
+# stays under the NATS default max_payload of 1 MiB
+EXPORT_CHUNK_SIZE = 512 * 1024
+
+# Responses are published as JSON arrays on export.response.batch; a batch
+# closes at either bound
+RESPONSE_SUBJECT = "export.response.batch"
+RESPONSE_BATCH_SIZE = 64
+RESPONSE_BATCH_BYTES = 512 * 1024
+
+# Processes rendering exports per worker. Every gunicorn worker owns a pool,
+# so the host total is WEB_CONCURRENCY * EXPORT_POOL_SIZE; by default each
+# worker takes its share of the cores
+EXPORT_POOL_SIZE = int(os.environ.get(
+    "EXPORT_POOL_SIZE",
+    max(1, (os.cpu_count() or 1) // int(os.environ.get("WEB_CONCURRENCY", 1))),
+))
+
 app = FastAPI(
     title="Export Worker",
     description="Workout data export service for PDF, CSV, and JSON formats",
@@ -29,28 +61,47 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Global instances
 export_service: ExportService = None
 nats_client: NATSClient = None
+response_queue: asyncio.Queue = None
+response_flusher: asyncio.Task = None
+export_pool: ProcessPoolExecutor = None
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global export_service, nats_client
+    global export_service, nats_client, response_queue, response_flusher, export_pool
     
     settings = get_settings()
     
     # Initialize export service
     export_service = ExportService()
     
+    # Render exports in separate processes so CPU-bound PDF/CSV work never
+    # holds the GIL of the process serving NATS and HTTP. Spawn rather than
+    # fork: this process already runs an event loop and helper threads.
+    export_pool = ProcessPoolExecutor(
+        max_workers=EXPORT_POOL_SIZE,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    
     # Initialize NATS client
     nats_client = NATSClient(settings.nats_url)
     await nats_client.connect()
     
-    # Subscribe to export requests
-    await nats_client.subscribe("export.request", handle_export_request)
+    # Start the response batcher before any request can queue a response
+    response_queue = asyncio.Queue()
+    response_flusher = asyncio.create_task(flush_responses())
+    
+    # Subscribe to export requests; the queue group hands each request to
+    # exactly one of the gunicorn worker processes
+    await nats_client.subscribe(
+        "export.request", handle_export_request, queue="export-workers", raw=True
+    )
     
     logger.info("Export worker started")
 
@@ -60,38 +111,41 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     global nats_client
     
+    if response_flusher:
+        response_flusher.cancel()
+        try:
+            await response_flusher
+        except asyncio.CancelledError:
+            pass
+        # Publish whatever was queued after the last flush
+        while not response_queue.empty():
+            await publish_responses(drain_responses(response_queue.get_nowait()))
+    
     if nats_client:
         await nats_client.disconnect()
     
+    if export_pool:
+        export_pool.shutdown(cancel_futures=True)
+    
     logger.info("Export worker stopped")
 
 
-async def handle_export_request(msg: Dict[str, Any]) -> None:
+async def handle_export_request(raw: bytes) -> None:
     """Handle export requests from NATS."""
+    # Decode and validate in one pass, straight from the payload bytes
+    try:
+        msg = request_decoder.decode(raw)
+    except msgspec.DecodeError as e:
+        logger.error(f"Invalid export request: {e}")
+        return
+    
+    request_id = msg.request_id
+    user_id = msg.user_id
+    
     try:
-        # Extract request data
-        user_id = msg.get("user_id")
-        session_ids = msg.get("session_ids", [])
-        format_type = msg.get("format", "json")
-        template = msg.get("template", "standard")
-        request_id = msg.get("request_id")
-        
-        if not user_id or not session_ids:
-            logger.error("Invalid export request: missing user_id or session_ids")
-            return
-        
         logger.info(f"Processing export request {request_id} for user {user_id}")
         
-        # Create export request
-        export_request = ExportRequest(
-            user_id=user_id,
-            session_ids=session_ids,
-            format=format_type,
-            template=template,
-            include_charts=msg.get("include_charts", True),
-            include_pose_data=msg.get("include_pose_data", False),
-            custom_fields=msg.get("custom_fields", [])
-        )
+        export_request = msg.to_export_request()
         
         # Validate request
         validation = await export_service.validate_export_request(export_request)
@@ -103,11 +157,11 @@ async def handle_export_request(msg: Dict[str, Any]) -> None:
                 "errors": validation['errors'],
                 "worker": "export-service"
             }
-            await nats_client.publish("export.response", error_response)
+            await queue_response(error_response)
             return
         
         # Generate export
-        result = await export_service.generate_export(export_request)
+        result = await run_export(export_request)
         
         # Prepare response
         response = {
@@ -117,13 +171,22 @@ async def handle_export_request(msg: Dict[str, Any]) -> None:
             **result
         }
         
-        # Encode binary data for NATS transmission
+        # File bytes go out as raw binary messages; the JSON response only
+        # carries metadata, so nothing is base64-encoded
         if result.get('success') and 'data' in result:
-            response['data_base64'] = base64.b64encode(result['data']).decode('utf-8')
             del response['data']  # Remove binary data
+            response.pop('path', None)  # Local to this worker
+            
+            response['data_subject'] = f"export.data.{request_id}"
+            try:
+                response['data_chunks'] = await publish_export_chunks(
+                    response['data_subject'], request_id, user_id, result
+                )
+            finally:
+                discard_export_file(result)
         
         # Publish response
-        await nats_client.publish("export.response", response)
+        await queue_response(response)
         
         logger.info(f"Export request {request_id} completed successfully")
         
@@ -132,19 +195,98 @@ async def handle_export_request(msg: Dict[str, Any]) -> None:
         
         # Send error response
         error_response = {
-            "request_id": msg.get("request_id"),
-            "user_id": msg.get("user_id"),
+            "request_id": request_id,
+            "user_id": user_id,
             "success": False,
             "error": str(e),
             "worker": "export-service"
         }
         
         try:
-            await nats_client.publish("export.response", error_response)
+            await queue_response(error_response)
         except Exception as publish_error:
             logger.error(f"Failed to publish error response: {publish_error}")
 
 
+async def run_export(export_request: ExportRequest) -> Dict[str, Any]:
+    """Generate an export in the process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(export_pool, generate_export_sync, export_request)
+
+
+async def queue_response(response: Dict[str, Any]) -> None:
+    """Encode a response and queue it for the next batch."""
+    await response_queue.put(encode_message(response))
+
+
+def drain_responses(first: bytes) -> List[bytes]:
+    """Collect ``first`` plus whatever is already queued, up to the batch bounds."""
+    batch = [first]
+    size = len(first)
+    while (
+        len(batch) < RESPONSE_BATCH_SIZE
+        and size < RESPONSE_BATCH_BYTES
+        and not response_queue.empty()
+    ):
+        payload = response_queue.get_nowait()
+        batch.append(payload)
+        size += len(payload)
+    return batch
+
+
+async def publish_responses(batch: List[bytes]) -> None:
+    """Publish pre-encoded responses as one JSON array."""
+    await nats_client.publish(RESPONSE_SUBJECT, b"[" + b",".join(batch) + b"]")
+
+
+async def flush_responses() -> None:
+    """Publish queued responses in batches.
+    
+    Never waits for a batch to fill: responses that queue up while the
+    previous publish is in flight ride together, a lone response goes out
+    immediately.
+    """
+    while True:
+        batch = drain_responses(await response_queue.get())
+        try:
+            await publish_responses(batch)
+        except Exception as e:
+            logger.error(f"Failed to publish {len(batch)} export responses: {e}")
+
+
+def parse_request(request_data: Dict[str, Any]) -> ExportRequest:
+    """Validate an HTTP request body, rejecting bad input with a 422."""
+    try:
+        return msgspec.convert(request_data, ExportRequestSchema).to_export_request()
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+async def publish_export_chunks(
+    subject: str, request_id: str, user_id: str, result: Dict[str, Any]
+) -> int:
+    """Publish export bytes as raw chunks, returning the chunk count.
+    
+    Requesters subscribe to ``export.data.<request_id>`` before sending the
+    request; chunks are sent before the response that announces them is
+    queued, so a received response means all chunks are already published.
+    Every chunk carries the file metadata in its headers, so a consumer can
+    reassemble the file without waiting for the response.
+    """
+    total = max(1, -(-result['file_size'] // EXPORT_CHUNK_SIZE))
+    for index, chunk in enumerate(iter_export_chunks(result, EXPORT_CHUNK_SIZE)):
+        await nats_client.publish(subject, chunk, headers={
+            "Request-Id": str(request_id),
+            "User-Id": user_id,
+            "Filename": result['filename'],
+            "Content-Type": result['mime_type'],
+            "Content-Encoding": result.get('content_encoding', 'identity'),
+            "Chunk": str(index),
+            "Chunks": str(total),
+        })
+    return total
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -152,8 +294,8 @@ async def health_check():
         "status": "healthy",
         "service": "export-worker",
         "version": "1.0.0",
-        "supported_formats": ["pdf", "csv", "json"],
-        "templates": list((await export_service.get_export_templates())["templates"].keys()) if export_service else []
+        "supported_formats": EXPORT_FORMATS,
+        "templates": TEMPLATE_NAMES
     }
 
 
@@ -161,16 +303,7 @@ async def health_check():
 async def create_export_endpoint(request_data: Dict[str, Any]):
     """HTTP endpoint for creating exports (for testing)."""
     try:
-        # Create export request from HTTP data
-        export_request = ExportRequest(
-            user_id=request_data.get("user_id"),
-            session_ids=request_data.get("session_ids", []),
-            format=request_data.get("format", "json"),
-            template=request_data.get("template", "standard"),
-            include_charts=request_data.get("include_charts", True),
-            include_pose_data=request_data.get("include_pose_data", False),
-            custom_fields=request_data.get("custom_fields", [])
-        )
+        export_request = parse_request(request_data)
         
         # Validate request
         validation = await export_service.validate_export_request(export_request)
@@ -178,17 +311,32 @@ async def create_export_endpoint(request_data: Dict[str, Any]):
             raise HTTPException(status_code=400, detail=validation['errors'])
         
         # Generate export
-        result = await export_service.generate_export(export_request)
+        result = await run_export(export_request)
         
         if not result.get('success'):
             raise HTTPException(status_code=500, detail=result.get('error', 'Export failed'))
         
+        # zstd exports are .zst files, not a transfer encoding; an explicit
+        # identity encoding keeps GZipMiddleware from compressing them again
+        headers = {"Content-Encoding": "identity"} if result.get('content_encoding') else None
+        
+        # Stream file-backed exports from disk, deleting the file once sent
+        if result.get('path'):
+            return FileResponse(
+                result['path'],
+                media_type=result['mime_type'],
+                filename=result['filename'],
+                headers=headers,
+                background=BackgroundTask(discard_export_file, result)
+            )
+        
         # Return file as response
         return Response(
             content=result['data'],
             media_type=result['mime_type'],
             headers={
-                "Content-Disposition": f"attachment; filename={result['filename']}"
+                "Content-Disposition": f"attachment; filename={result['filename']}",
+                **(headers or {})
             }
         )
         
@@ -214,19 +362,13 @@ async def get_templates_endpoint():
 async def validate_request_endpoint(request_data: Dict[str, Any]):
     """Validate export request parameters."""
     try:
-        export_request = ExportRequest(
-            user_id=request_data.get("user_id"),
-            session_ids=request_data.get("session_ids", []),
-            format=request_data.get("format", "json"),
-            template=request_data.get("template", "standard"),
-            include_charts=request_data.get("include_charts", True),
-            include_pose_data=request_data.get("include_pose_data", False),
-            custom_fields=request_data.get("custom_fields", [])
-        )
+        export_request = parse_request(request_data)
         
         validation = await export_service.validate_export_request(export_request)
         return {"success": True, "validation": validation}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error validating request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -255,6 +397,12 @@ async def get_supported_formats():
                 "description": "JSON format for programmatic access",
                 "mime_type": "application/json",
                 "supports_charts": False
+            },
+            {
+                "name": "feather",
+                "description": "Arrow Feather columns for pandas/polars analysis",
+                "mime_type": "application/vnd.apache.arrow.file",
+                "supports_charts": False
             }
         ]
     }
@@ -263,13 +411,26 @@ async def get_supported_formats():
 def main():
     """Main entry point."""
     settings = get_settings()
-    uvicorn.run(
+    
+    if settings.debug:
+        uvicorn.run(
+            "workers.export.main:app",
+            host="0.0.0.0",
+            port=settings.export_worker_port,
+            loop="uvloop",
+            http="httptools",
+            reload=True,
+            log_level="debug",
+        )
+        return
+    
+    # Hand the process over to gunicorn to spread exports across cores
+    os.execvp("gunicorn", [
+        "gunicorn",
         "workers.export.main:app",
-        host="0.0.0.0",
-        port=settings.export_worker_port,
-        reload=settings.debug,
-        log_level="info" if not settings.debug else "debug",
-    )
+        "-c", "python:workers.export.gunicorn_conf",
+        "--bind", f"0.0.0.0:{settings.export_worker_port}",
+    ])
 
 
 if __name__ == "__main__":
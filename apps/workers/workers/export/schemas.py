@@ -0,0 +1,43 @@
+"""Typed request payloads for the export worker."""
+
+from typing import Annotated, Dict, List, Optional
+
+import msgspec
+
+from .export_service import ExportRequest
+
+NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+
+class ExportRequestSchema(msgspec.Struct):
+    """Export request as received over NATS or HTTP; unknown fields are ignored."""
+    user_id: NonEmptyStr
+    session_ids: Annotated[List[str], msgspec.Meta(min_length=1)]
+    format: str = "json"
+    template: str = "standard"
+    date_range: Optional[Dict[str, str]] = None
+    include_charts: bool = True
+    include_pose_data: bool = False
+    custom_fields: List[str] = []
+    # Checked by ExportService.validate_export_request, so an unsupported
+    # value gets an error response instead of a dropped request
+    compression: Optional[str] = None
+    request_id: Optional[str] = None
+
+    def to_export_request(self) -> ExportRequest:
+        """Build the service-level request."""
+        return ExportRequest(
+            user_id=self.user_id,
+            session_ids=self.session_ids,
+            format=self.format,
+            date_range=self.date_range,
+            include_charts=self.include_charts,
+            include_pose_data=self.include_pose_data,
+            template=self.template,
+            custom_fields=self.custom_fields,
+            compression=self.compression,
+        )
+
+
+# Shared decoder for raw export.request payloads
+request_decoder = msgspec.json.Decoder(ExportRequestSchema)
@@ -0,0 +1,96 @@
+"""Exercise-term corrections for transcribed voice commands."""
+
+import logging
+import re
+from types import MappingProxyType
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Read-only so the table can be shared freely between threads
+CORRECTIONS = MappingProxyType({
+    # Common mispronunciations/misspellings
+    "pushup": "push-up",
+    "pushups": "push-ups",
+    "press up": "push-up",
+    "press ups": "push-ups",
+    "squat": "squats",
+    "lunge": "lunges",
+    "plank": "planks",
+    "jumping jack": "jumping-jacks",
+    "star jump": "jumping-jacks",
+    "star jumps": "jumping-jacks",
+
+    # Form cues
+    "strait": "straight",
+    "aline": "align",
+    "bended": "bent",
+    "lowwer": "lower",
+})
+
+
+def _build_automaton() -> "ahocorasick.Automaton":
+    """Build the Aho-Corasick automaton over all mistakes."""
+    automaton = ahocorasick.Automaton()
+    for mistake, correction in CORRECTIONS.items():
+        automaton.add_word(mistake, (len(mistake), correction))
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import; finds every mistake in a single pass over the text
+_AUTOMATON = _build_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Fallback with the same semantics: longest alternatives first, whole words only
+_CORRECTIONS_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(m) for m in sorted(CORRECTIONS, key=len, reverse=True)) + r')\b'
+)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex ``\\w`` class used for word boundaries."""
+    return char.isalnum() or char == "_"
+
+
+def _replace_matches(text: str) -> str:
+    """Replace whole-word mistakes found by the automaton, longest first."""
+    last = len(text) - 1
+    matches: List[Tuple[int, int, str]] = []
+    for end, (length, correction) in _AUTOMATON.iter(text):
+        start = end - length + 1
+        # Skip hits inside longer words, e.g. "squat" in "squatting"
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end + 1]):
+            continue
+        matches.append((start, -length, correction))
+
+    if not matches:
+        return text
+
+    # Leftmost match wins; at equal starts the longer mistake wins
+    matches.sort()
+    pieces = []
+    pos = 0
+    for start, neg_length, correction in matches:
+        if start < pos:
+            continue
+        pieces.append(text[pos:start])
+        pieces.append(correction)
+        pos = start - neg_length
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
+def correct_exercise_terms(text: str) -> str:
+    """Correct common exercise term mistakes."""
+    corrected = text.lower()
+    if AHOCORASICK_AVAILABLE:
+        return _replace_matches(corrected)
+    return _CORRECTIONS_RE.sub(lambda m: CORRECTIONS[m.group(0)], corrected)
@@ -1,15 +1,57 @@
 """NLP intent parsing and command processing."""
 
 import asyncio
+import functools
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
 
 logger = logging.getLogger(__name__)
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_CONTRACTIONS = {
+    "i'm": "i am",
+    "let's": "let us",
+    "that's": "that is",
+    "what's": "what is",
+    "how's": "how is",
+    "can't": "cannot",
+    "won't": "will not",
+    "don't": "do not",
+}
+_CONTRACTIONS_RE = re.compile('|'.join(re.escape(c) for c in _CONTRACTIONS))
+
+# Substring fallbacks for exercise names, checked in order
+_EXERCISE_FRAGMENTS = (
+    ('push', 'push-ups'),
+    ('squat', 'squats'),
+    ('lunge', 'lunges'),
+    ('plank', 'planks'),
+    ('jump', 'jumping-jacks'),
+)
+
+# Distinct normalized utterances remembered per parser
+PARSE_CACHE_SIZE = 2048
+
+# One-word commands that make up most voice traffic
+_LITERAL_TRIGGERS = (
+    'pause', 'wait', 'hold', 'stop', 'resume', 'continue', 'start', 'go',
+    'end', 'finish', 'quit', 'done', 'next', 'skip', 'repeat', 'again', 'redo',
+    'easier', 'reduce', 'less', 'lower', 'harder', 'increase', 'more', 'higher',
+    'help',
+)
+
 
 class IntentType(Enum):
     """Supported intent types."""
@@ -47,6 +89,194 @@ class Entity:
     end_pos: int
 
 
+def _build_patterns() -> Dict[IntentType, List[re.Pattern]]:
+    """Build the compiled intent patterns."""
+    patterns = {
+        IntentType.PAUSE: [
+            r'\b(pause|stop|wait|hold)\b',
+            r'\btake a (break|rest)\b',
+            r'\bstop (for a moment|briefly)\b',
+            r'\bhold on\b',
+        ],
+        IntentType.RESUME: [
+            r'\b(resume|continue|start|go)\b',
+            r'\blet\'s (continue|go|start)\b',
+            r'\bkeep going\b',
+            r'\bmove on\b',
+        ],
+        IntentType.STOP: [
+            r'\b(stop|end|finish|quit|done)\b',
+            r'\bthat\'s (enough|it)\b',
+            r'\bi\'m (done|finished)\b',
+            r'\bend (workout|session)\b',
+        ],
+        IntentType.NEXT: [
+            r'\b(next|skip|move on)\b',
+            r'\bnext (exercise|one)\b',
+            r'\bskip (this|ahead)\b',
+            r'\bmove to next\b',
+        ],
+        IntentType.REPEAT: [
+            r'\b(repeat|again|redo)\b',
+            r'\bdo (it|that) again\b',
+            r'\bone more time\b',
+            r'\brepeat (exercise|set)\b',
+        ],
+        IntentType.EASIER: [
+            r'\b(easier|reduce|less|lower)\b',
+            r'\bmake it easier\b',
+            r'\btoo (hard|difficult)\b',
+            r'\breduce (difficulty|intensity)\b',
+            r'\bfewer reps\b',
+        ],
+        IntentType.HARDER: [
+            r'\b(harder|increase|more|higher)\b',
+            r'\bmake it harder\b',
+            r'\btoo easy\b',
+            r'\bincrease (difficulty|intensity)\b',
+            r'\bmore reps\b',
+        ],
+        IntentType.FORM_CHECK: [
+            r'\bhow (am i doing|is my form)\b',
+            r'\bcheck my form\b',
+            r'\bam i doing (this|it) (right|correctly)\b',
+            r'\bform (feedback|check)\b',
+            r'\bhow does it look\b',
+        ],
+        IntentType.REP_COUNT: [
+            r'\bhow many (reps|repetitions)\b',
+            r'\bwhat\'s my (count|rep count)\b',
+            r'\bcount (reps|repetitions)\b',
+            r'\bhow many have i done\b',
+        ],
+        IntentType.HELP: [
+            r'\bhelp\b',
+            r'\bwhat (can i say|commands)\b',
+            r'\bvoice commands\b',
+            r'\bwhat can you do\b',
+        ],
+        IntentType.EXERCISE_SELECT: [
+            r'\blet\'s do (push.?ups?|squats?|lunges?|planks?)\b',
+            r'\bstart (push.?ups?|squats?|lunges?|planks?)\b',
+            r'\bi want to do (push.?ups?|squats?|lunges?|planks?)\b',
+        ],
+    }
+    return {
+        intent_type: [re.compile(p, re.IGNORECASE) for p in intent_patterns]
+        for intent_type, intent_patterns in patterns.items()
+    }
+
+
+def _build_entity_patterns() -> Dict[str, List[re.Pattern]]:
+    """Build the compiled entity extraction patterns."""
+    patterns = {
+        'exercise': [
+            r'\b(push.?ups?|squats?|lunges?|planks?|jumping.?jacks?)\b',
+        ],
+        'number': [
+            r'\b(\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\b',
+        ],
+        'duration': [
+            r'\b(\d+)\s*(seconds?|minutes?|mins?|secs?)\b',
+        ],
+    }
+    return {
+        entity_type: [re.compile(p, re.IGNORECASE) for p in entity_patterns]
+        for entity_type, entity_patterns in patterns.items()
+    }
+
+
+def _build_synonyms() -> Dict[str, Dict[str, List[str]]]:
+    """Build the synonym mappings."""
+    return {
+        'exercise': {
+            'push-ups': ['pushups', 'push ups', 'press ups'],
+            'squats': ['squat'],
+            'lunges': ['lunge'],
+            'planks': ['plank', 'planking'],
+            'jumping-jacks': ['jumping jacks', 'star jumps'],
+        },
+        'numbers': {
+            '1': ['one'], '2': ['two'], '3': ['three'], '4': ['four'], '5': ['five'],
+            '6': ['six'], '7': ['seven'], '8': ['eight'], '9': ['nine'], '10': ['ten'],
+            '11': ['eleven'], '12': ['twelve'], '13': ['thirteen'], '14': ['fourteen'], '15': ['fifteen'],
+            '16': ['sixteen'], '17': ['seventeen'], '18': ['eighteen'], '19': ['nineteen'], '20': ['twenty'],
+        }
+    }
+
+
+# Compiled once at import and shared read-only by every parser
+_PATTERNS = MappingProxyType(_build_patterns())
+_ENTITY_PATTERNS = MappingProxyType(_build_entity_patterns())
+_SYNONYMS = MappingProxyType(_build_synonyms())
+
+
+# Response text per intent; REP_COUNT and EXERCISE_SELECT are format
+# templates filled in by generate_response
+_RESPONSES = MappingProxyType({
+    IntentType.PAUSE: {
+        'action': 'pause_session',
+        'message': 'Pausing your workout. Say "resume" when you\'re ready to continue.',
+        'tts': 'Workout paused. Say resume when ready.',
+    },
+    IntentType.RESUME: {
+        'action': 'resume_session',
+        'message': 'Resuming your workout. Let\'s keep going!',
+        'tts': 'Resuming workout. Let\'s keep going!',
+    },
+    IntentType.STOP: {
+        'action': 'end_session',
+        'message': 'Ending your workout session. Great job today!',
+        'tts': 'Ending workout. Great job today!',
+    },
+    IntentType.NEXT: {
+        'action': 'next_exercise',
+        'message': 'Moving to the next exercise.',
+        'tts': 'Moving to next exercise.',
+    },
+    IntentType.REPEAT: {
+        'action': 'repeat_exercise',
+        'message': 'Repeating the current exercise.',
+        'tts': 'Repeating current exercise.',
+    },
+    IntentType.EASIER: {
+        'action': 'reduce_difficulty',
+        'message': 'Reducing difficulty. You\'ve got this!',
+        'tts': 'Making it easier. You\'ve got this!',
+    },
+    IntentType.HARDER: {
+        'action': 'increase_difficulty',
+        'message': 'Increasing difficulty. Challenge accepted!',
+        'tts': 'Making it harder. Challenge accepted!',
+    },
+    IntentType.FORM_CHECK: {
+        'action': 'provide_form_feedback',
+        'message': 'Checking your form...',
+        'tts': 'Let me check your form.',
+    },
+    IntentType.REP_COUNT: {
+        'action': 'provide_rep_count',
+        'message': 'You\'ve completed {rep_count} reps.',
+        'tts': 'You have done {rep_count} reps.',
+    },
+    IntentType.HELP: {
+        'action': 'show_help',
+        'message': 'Available commands: pause, resume, next, easier, harder, form check, rep count.',
+        'tts': 'You can say pause, resume, next, easier, harder, form check, or rep count.',
+    },
+    IntentType.EXERCISE_SELECT: {
+        'action': 'select_exercise',
+        'message': 'Starting {exercise}.',
+        'tts': 'Starting {exercise}.',
+    },
+})
+_UNKNOWN_RESPONSE = {
+    'action': 'unknown_command',
+    'message': 'I didn\'t understand that command. Say "help" for available commands.',
+    'tts': 'I didn\'t understand. Say help for commands.',
+}
+
+
 class IntentParser:
     """Rule-based intent parser for exercise commands."""
     
@@ -54,128 +284,118 @@ class IntentParser:
         self.patterns = self._load_patterns()
         self.entities_patterns = self._load_entity_patterns()
         self.synonyms = self._load_synonyms()
+        self._exercise_map = {
+            name: canonical
+            for canonical, synonyms in self.synonyms['exercise'].items()
+            for name in (canonical, *synonyms)
+        }
+        self._word_to_int = {
+            word: int(digit)
+            for digit, words in self.synonyms['numbers'].items()
+            for word in words
+        }
+        self._master_intent_re, self._intent_res = self._build_fused_patterns(self.patterns)
+        self._flat_patterns = [
+            (intent_type, pattern)
+            for intent_type, intent_patterns in self.patterns.items()
+            for pattern in intent_patterns
+        ]
+        self._hs_db = self._build_hyperscan_db()
+        # Voice commands repeat heavily; cached results are copied out in
+        # parse_intent so callers never mutate a shared entry
+        self._parse_cached = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_normalized)
+        self._literal_intents = {
+            word: self._scan_intent_patterns(word) for word in _LITERAL_TRIGGERS
+        }
         
-    def _load_patterns(self) -> Dict[IntentType, List[str]]:
+    @staticmethod
+    def _load_patterns() -> Mapping[IntentType, List[re.Pattern]]:
         """Load intent patterns."""
-        return {
-            IntentType.PAUSE: [
-                r'\b(pause|stop|wait|hold)\b',
-                r'\btake a (break|rest)\b',
-                r'\bstop (for a moment|briefly)\b',
-                r'\bhold on\b',
-            ],
-            IntentType.RESUME: [
-                r'\b(resume|continue|start|go)\b',
-                r'\blet\'s (continue|go|start)\b',
-                r'\bkeep going\b',
-                r'\bmove on\b',
-            ],
-            IntentType.STOP: [
-                r'\b(stop|end|finish|quit|done)\b',
-                r'\bthat\'s (enough|it)\b',
-                r'\bi\'m (done|finished)\b',
-                r'\bend (workout|session)\b',
-            ],
-            IntentType.NEXT: [
-                r'\b(next|skip|move on)\b',
-                r'\bnext (exercise|one)\b',
-                r'\bskip (this|ahead)\b',
-                r'\bmove to next\b',
-            ],
-            IntentType.REPEAT: [
-                r'\b(repeat|again|redo)\b',
-                r'\bdo (it|that) again\b',
-                r'\bone more time\b',
-                r'\brepeat (exercise|set)\b',
-            ],
-            IntentType.EASIER: [
-                r'\b(easier|reduce|less|lower)\b',
-                r'\bmake it easier\b',
-                r'\btoo (hard|difficult)\b',
-                r'\breduce (difficulty|intensity)\b',
-                r'\bfewer reps\b',
-            ],
-            IntentType.HARDER: [
-                r'\b(harder|increase|more|higher)\b',
-                r'\bmake it harder\b',
-                r'\btoo easy\b',
-                r'\bincrease (difficulty|intensity)\b',
-                r'\bmore reps\b',
-            ],
-            IntentType.FORM_CHECK: [
-                r'\bhow (am i doing|is my form)\b',
-                r'\bcheck my form\b',
-                r'\bam i doing (this|it) (right|correctly)\b',
-                r'\bform (feedback|check)\b',
-                r'\bhow does it look\b',
-            ],
-            IntentType.REP_COUNT: [
-                r'\bhow many (reps|repetitions)\b',
-                r'\bwhat\'s my (count|rep count)\b',
-                r'\bcount (reps|repetitions)\b',
-                r'\bhow many have i done\b',
-            ],
-            IntentType.HELP: [
-                r'\bhelp\b',
-                r'\bwhat (can i say|commands)\b',
-                r'\bvoice commands\b',
-                r'\bwhat can you do\b',
-            ],
-            IntentType.EXERCISE_SELECT: [
-                r'\blet\'s do (push.?ups?|squats?|lunges?|planks?)\b',
-                r'\bstart (push.?ups?|squats?|lunges?|planks?)\b',
-                r'\bi want to do (push.?ups?|squats?|lunges?|planks?)\b',
-            ],
-        }
+        return _PATTERNS
     
-    def _load_entity_patterns(self) -> Dict[str, List[str]]:
-        """Load entity extraction patterns."""
-        return {
-            'exercise': [
-                r'\b(push.?ups?|squats?|lunges?|planks?|jumping.?jacks?)\b',
-            ],
-            'number': [
-                r'\b(\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\b',
-            ],
-            'duration': [
-                r'\b(\d+)\s*(seconds?|minutes?|mins?|secs?)\b',
-            ],
+    def _build_fused_patterns(
+        self, patterns: Dict[IntentType, List[re.Pattern]]
+    ) -> Tuple[re.Pattern, Dict[IntentType, re.Pattern]]:
+        """Fuse intent patterns into one master alternation and one per intent."""
+        intent_res = {
+            intent_type: re.compile('|'.join(f"(?:{p.pattern})" for p in intent_patterns), re.IGNORECASE)
+            for intent_type, intent_patterns in patterns.items()
         }
+        master = re.compile(
+            '|'.join(f"(?P<{intent_type.name}>{fused.pattern})" for intent_type, fused in intent_res.items()),
+            re.IGNORECASE
+        )
+        return master, intent_res
+
+    def _build_hyperscan_db(self) -> Optional["hyperscan.Database"]:
+        """Compile every intent pattern into one Hyperscan database, if available."""
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        count = len(self._flat_patterns)
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[pattern.pattern.encode('utf-8') for _, pattern in self._flat_patterns],
+                ids=list(range(count)),
+                elements=count,
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * count,
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Hyperscan compile failed, using re prefilter: {e}")
+            return None
+
+    def _candidate_patterns(self, text: str) -> List[Tuple[IntentType, re.Pattern]]:
+        """Return the intent patterns that match somewhere in text."""
+        # Hyperscan reports every matching pattern id in one SIMD scan.
+        # ASCII only, so its \b agrees with re's Unicode word boundaries.
+        if self._hs_db is not None and text.isascii():
+            hits = []
+            self._hs_db.scan(
+                text.encode('ascii'),
+                match_event_handler=lambda pattern_id, start, end, flags, context: hits.append(pattern_id)
+            )
+            # Sorted ids keep pattern order, which breaks confidence ties
+            return [self._flat_patterns[i] for i in sorted(hits)]
+        
+        # One pass over the master alternation rejects utterances that match
+        # no intent at all. Alternation stops at the first alternative that
+        # matches, not the longest, so scoring still checks each pattern of
+        # each intent whose fused pattern hits.
+        if self._master_intent_re.search(text) is None:
+            return []
+        
+        return [
+            (intent_type, pattern)
+            for intent_type, intent_patterns in self.patterns.items()
+            if self._intent_res[intent_type].search(text) is not None
+            for pattern in intent_patterns
+        ]
+
+    @staticmethod
+    def _load_entity_patterns() -> Mapping[str, List[re.Pattern]]:
+        """Load entity extraction patterns."""
+        return _ENTITY_PATTERNS
     
-    def _load_synonyms(self) -> Dict[str, List[str]]:
+    @staticmethod
+    def _load_synonyms() -> Mapping[str, Dict[str, List[str]]]:
         """Load synonym mappings."""
-        return {
-            'exercise': {
-                'push-ups': ['pushups', 'push ups', 'press ups'],
-                'squats': ['squat'],
-                'lunges': ['lunge'],
-                'planks': ['plank', 'planking'],
-                'jumping-jacks': ['jumping jacks', 'star jumps'],
-            },
-            'numbers': {
-                '1': ['one'], '2': ['two'], '3': ['three'], '4': ['four'], '5': ['five'],
-                '6': ['six'], '7': ['seven'], '8': ['eight'], '9': ['nine'], '10': ['ten'],
-                '11': ['eleven'], '12': ['twelve'], '13': ['thirteen'], '14': ['fourteen'], '15': ['fifteen'],
-                '16': ['sixteen'], '17': ['seventeen'], '18': ['eighteen'], '19': ['nineteen'], '20': ['twenty'],
-            }
-        }
+        return _SYNONYMS
 
     async def parse_intent(self, text: str, timestamp: float = 0) -> Intent:
         """Parse intent from text input."""
         try:
             # Normalize text
-            normalized_text = await self._normalize_text(text)
-            
-            # Extract entities first
-            entities = await self._extract_entities(normalized_text)
+            normalized_text = self._normalize_text(text)
             
-            # Match intent patterns
-            intent_type, confidence = await self._match_intent(normalized_text)
+            # Entities and intent depend only on the normalized text
+            intent_type, confidence, entities = self._parse_cached(normalized_text)
             
             return Intent(
                 type=intent_type,
                 confidence=confidence,
-                entities=entities,
+                entities={name: [dict(e) for e in found] for name, found in entities.items()},
                 original_text=text,
                 timestamp=timestamp
             )
@@ -190,46 +410,44 @@ class IntentParser:
                 timestamp=timestamp
             )
 
-    async def _normalize_text(self, text: str) -> str:
+    def _parse_normalized(self, text: str) -> Tuple[IntentType, float, Dict[str, Any]]:
+        """Extract entities and match the intent for normalized text."""
+        # Extract entities first
+        entities = self._extract_entities(text)
+        
+        # Match intent patterns
+        intent_type, confidence = self._match_intent(text)
+        
+        return intent_type, confidence, entities
+
+    def _normalize_text(self, text: str) -> str:
         """Normalize input text."""
         # Convert to lowercase
         text = text.lower().strip()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Expand contractions
-        contractions = {
-            "i'm": "i am",
-            "let's": "let us",
-            "that's": "that is",
-            "what's": "what is",
-            "how's": "how is",
-            "can't": "cannot",
-            "won't": "will not",
-            "don't": "do not",
-        }
-        
-        for contraction, expansion in contractions.items():
-            text = text.replace(contraction, expansion)
+        # Expand contractions in a single pass
+        text = _CONTRACTIONS_RE.sub(lambda m: _CONTRACTIONS[m.group(0)], text)
         
         return text
 
-    async def _extract_entities(self, text: str) -> Dict[str, Any]:
+    def _extract_entities(self, text: str) -> Dict[str, Any]:
         """Extract named entities from text."""
         entities = {}
         
         for entity_type, patterns in self.entities_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     entity_value = match.group(1) if match.groups() else match.group(0)
                     
                     # Normalize entity value
                     if entity_type == 'exercise':
-                        entity_value = await self._normalize_exercise_name(entity_value)
+                        entity_value = self._normalize_exercise_name(entity_value)
                     elif entity_type == 'number':
-                        entity_value = await self._normalize_number(entity_value)
+                        entity_value = self._normalize_number(entity_value)
                     
                     if entity_type not in entities:
                         entities[entity_type] = []
@@ -244,30 +462,23 @@ class IntentParser:
         
         return entities
 
-    async def _normalize_exercise_name(self, exercise: str) -> str:
+    def _normalize_exercise_name(self, exercise: str) -> str:
         """Normalize exercise names."""
         exercise = exercise.lower().strip()
         
         # Check synonyms
-        for canonical, synonyms in self.synonyms['exercise'].items():
-            if exercise in synonyms or exercise == canonical:
-                return canonical
+        canonical = self._exercise_map.get(exercise)
+        if canonical is not None:
+            return canonical
         
         # Handle common variations
-        if 'push' in exercise:
-            return 'push-ups'
-        elif 'squat' in exercise:
-            return 'squats'
-        elif 'lunge' in exercise:
-            return 'lunges'
-        elif 'plank' in exercise:
-            return 'planks'
-        elif 'jump' in exercise:
-            return 'jumping-jacks'
+        for fragment, canonical in _EXERCISE_FRAGMENTS:
+            if fragment in exercise:
+                return canonical
         
         return exercise
 
-    async def _normalize_number(self, number: str) -> int:
+    def _normalize_number(self, number: str) -> int:
         """Convert number words to integers."""
         number = number.lower().strip()
         
@@ -275,38 +486,37 @@ class IntentParser:
         if number.isdigit():
             return int(number)
         
-        # Convert word numbers
-        for digit, words in self.synonyms['numbers'].items():
-            if number in words:
-                return int(digit)
-        
-        # Handle special cases
-        number_map = {
-            'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-            'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-            'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-        }
-        
-        return number_map.get(number, 0)
+        # Unknown words (including "zero") map to 0
+        return self._word_to_int.get(number, 0)
 
-    async def _match_intent(self, text: str) -> Tuple[IntentType, float]:
+    def _match_intent(self, text: str) -> Tuple[IntentType, float]:
         """Match text against intent patterns."""
+        # Single-word commands were scored once at init with the same
+        # patterns, so the lookup returns exactly what a scan would
+        literal = self._literal_intents.get(text)
+        if literal is not None:
+            return literal
+        
+        return self._scan_intent_patterns(text)
+
+    def _scan_intent_patterns(self, text: str) -> Tuple[IntentType, float]:
+        """Score every candidate intent pattern against text."""
         best_intent = IntentType.UNKNOWN
         best_confidence = 0.0
         
-        for intent_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Calculate confidence based on match quality
-                    match_length = len(match.group(0))
-                    text_length = len(text)
-                    confidence = min(0.95, 0.7 + (match_length / text_length) * 0.25)
-                    
-                    if confidence > best_confidence:
-                        best_intent = intent_type
-                        best_confidence = confidence
+        # Candidates are prefiltered; the exact span still comes from re so
+        # confidence is computed exactly as before
+        for intent_type, pattern in self._candidate_patterns(text):
+            match = pattern.search(text)
+            if match:
+                # Calculate confidence based on match quality
+                match_length = len(match.group(0))
+                text_length = len(text)
+                confidence = min(0.95, 0.7 + (match_length / text_length) * 0.25)
+                
+                if confidence > best_confidence:
+                    best_intent = intent_type
+                    best_confidence = confidence
         
         return best_intent, best_confidence
 
@@ -314,69 +524,17 @@ class IntentParser:
         """Generate appropriate response for parsed intent."""
         context = context or {}
         
-        responses = {
-            IntentType.PAUSE: {
-                'action': 'pause_session',
-                'message': 'Pausing your workout. Say "resume" when you\'re ready to continue.',
-                'tts': 'Workout paused. Say resume when ready.',
-            },
-            IntentType.RESUME: {
-                'action': 'resume_session',
-                'message': 'Resuming your workout. Let\'s keep going!',
-                'tts': 'Resuming workout. Let\'s keep going!',
-            },
-            IntentType.STOP: {
-                'action': 'end_session',
-                'message': 'Ending your workout session. Great job today!',
-                'tts': 'Ending workout. Great job today!',
-            },
-            IntentType.NEXT: {
-                'action': 'next_exercise',
-                'message': 'Moving to the next exercise.',
-                'tts': 'Moving to next exercise.',
-            },
-            IntentType.REPEAT: {
-                'action': 'repeat_exercise',
-                'message': 'Repeating the current exercise.',
-                'tts': 'Repeating current exercise.',
-            },
-            IntentType.EASIER: {
-                'action': 'reduce_difficulty',
-                'message': 'Reducing difficulty. You\'ve got this!',
-                'tts': 'Making it easier. You\'ve got this!',
-            },
-            IntentType.HARDER: {
-                'action': 'increase_difficulty',
-                'message': 'Increasing difficulty. Challenge accepted!',
-                'tts': 'Making it harder. Challenge accepted!',
-            },
-            IntentType.FORM_CHECK: {
-                'action': 'provide_form_feedback',
-                'message': 'Checking your form...',
-                'tts': 'Let me check your form.',
-            },
-            IntentType.REP_COUNT: {
-                'action': 'provide_rep_count',
-                'message': f'You\'ve completed {context.get("rep_count", 0)} reps.',
-                'tts': f'You have done {context.get("rep_count", 0)} reps.',
-            },
-            IntentType.HELP: {
-                'action': 'show_help',
-                'message': 'Available commands: pause, resume, next, easier, harder, form check, rep count.',
-                'tts': 'You can say pause, resume, next, easier, harder, form check, or rep count.',
-            },
-            IntentType.EXERCISE_SELECT: {
-                'action': 'select_exercise',
-                'message': f'Starting {intent.entities.get("exercise", [{}])[0].get("value", "exercise")}.',
-                'tts': f'Starting {intent.entities.get("exercise", [{}])[0].get("value", "exercise")}.',
-            },
-        }
+        response = dict(_RESPONSES.get(intent.type, _UNKNOWN_RESPONSE))
         
-        response = responses.get(intent.type, {
-            'action': 'unknown_command',
-            'message': 'I didn\'t understand that command. Say "help" for available commands.',
-            'tts': 'I didn\'t understand. Say help for commands.',
-        })
+        # Only two responses carry per-call values
+        if intent.type == IntentType.REP_COUNT:
+            rep_count = context.get("rep_count", 0)
+            response['message'] = response['message'].format(rep_count=rep_count)
+            response['tts'] = response['tts'].format(rep_count=rep_count)
+        elif intent.type == IntentType.EXERCISE_SELECT:
+            exercise = intent.entities.get("exercise", [{}])[0].get("value", "exercise")
+            response['message'] = response['message'].format(exercise=exercise)
+            response['tts'] = response['tts'].format(exercise=exercise)
         
         # Add intent information
         response.update({
@@ -10,6 +10,7 @@ import uvicorn
 
 from ..shared.config import get_settings
 from ..shared.nats_client import NATSClient
+from .corrections import correct_exercise_terms
 from .intent_parser import IntentParser
 
 logger = logging.getLogger(__name__)
@@ -104,8 +105,8 @@ async def handle_voice_command(msg: Dict[str, Any]) -> None:
             "worker": "nlp-processor"
         })
         
-        # Publish intent result
-        await nats_client.publish("nlp.intent", response)
+        # Intent result, plus an action and a coaching cue when applicable
+        publishes = [nats_client.publish("nlp.intent", response)]
         
         # Publish specific action if needed
         action = response.get("action")
@@ -119,7 +120,7 @@ async def handle_voice_command(msg: Dict[str, Any]) -> None:
                 "timestamp": timestamp,
                 "worker": "nlp-processor"
             }
-            await nats_client.publish(f"action.{action}", action_msg)
+            publishes.append(nats_client.publish(f"action.{action}", action_msg))
         
         # Generate coaching cue if appropriate
         if response.get("tts"):
@@ -133,7 +134,11 @@ async def handle_voice_command(msg: Dict[str, Any]) -> None:
                 "source": "voice_command",
                 "worker": "nlp-processor"
             }
-            await nats_client.publish("coaching.cue", cue_msg)
+            publishes.append(nats_client.publish("coaching.cue", cue_msg))
+        
+        # Publishes only append to the client's write buffer, so they are
+        # issued together and leave in the same flush
+        await asyncio.gather(*publishes)
         
     except Exception as e:
         logger.error(f"Error processing voice command: {e}")
@@ -165,7 +170,7 @@ async def handle_nlp_request(msg: Dict[str, Any]) -> None:
         
         elif request_type == "text_substitution":
             # Handle text substitution/correction
-            corrected_text = await correct_exercise_terms(text)
+            corrected_text = correct_exercise_terms(text)
             
             response = {
                 "session_id": session_id,
@@ -181,35 +186,6 @@ async def handle_nlp_request(msg: Dict[str, Any]) -> None:
         logger.error(f"Error processing NLP request: {e}")
 
 
-async def correct_exercise_terms(text: str) -> str:
-    """Correct common exercise term mistakes."""
-    corrections = {
-        # Common mispronunciations/misspellings
-        "pushup": "push-up",
-        "pushups": "push-ups",
-        "press up": "push-up",
-        "press ups": "push-ups",
-        "squat": "squats",
-        "lunge": "lunges",
-        "plank": "planks",
-        "jumping jack": "jumping-jacks",
-        "star jump": "jumping-jacks",
-        "star jumps": "jumping-jacks",
-        
-        # Form cues
-        "strait": "straight",
-        "aline": "align",
-        "bended": "bent",
-        "lowwer": "lower",
-    }
-    
-    corrected = text.lower()
-    for mistake, correction in corrections.items():
-        corrected = corrected.replace(mistake, correction)
-    
-    return corrected
-
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -281,6 +257,8 @@ def main():
         "workers.nlp.main:app",
         host="0.0.0.0",
         port=settings.nlp_worker_port,
+        loop="uvloop",
+        http="httptools",
         reload=settings.debug,
         log_level="info" if not settings.debug else "debug",
     )
@@ -2,15 +2,15 @@
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Set
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from ..shared.config import get_settings
-from ..shared.nats_client import NATSClient
-from .pose_detector import PoseDetector
+from ..shared.nats_client import NATSClient, decode_message
+from .pose_detector import PoseDetector, with_keypoint_dict
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,8 @@ app.add_middleware(
 # Global instances
 pose_detector: PoseDetector = None
 nats_client: NATSClient = None
+# Publish tasks still waiting on their batch; held so they are not collected
+pending_results: Set[asyncio.Task] = set()
 
 
 @app.on_event("startup")
@@ -41,7 +43,10 @@ async def startup_event():
     settings = get_settings()
     
     # Initialize pose detector
-    pose_detector = PoseDetector()
+    pose_detector = PoseDetector(
+        model_complexity=settings.pose_model_complexity,
+        landmarker_model_path=settings.pose_landmarker_model if settings.pose_int8 else None,
+    )
     await pose_detector.initialize()
     
     # Initialize NATS client
@@ -49,7 +54,16 @@ async def startup_event():
     await nats_client.connect()
     
     # Subscribe to pose detection requests
-    await nats_client.subscribe("pose.detect", handle_pose_detection)
+    # Frames beyond the small pending backlog are dropped by the client
+    # rather than queued behind slower inference
+    await nats_client.subscribe(
+        "pose.detect",
+        handle_pose_detection,
+        raw=True,
+        with_headers=True,
+        pending_msgs_limit=8,
+        pending_bytes_limit=64 * 1024 * 1024,
+    )
     
     logger.info("Pose detection worker started")
 
@@ -62,26 +76,72 @@ async def shutdown_event():
     if pose_detector:
         await pose_detector.cleanup()
     
+    # Cleanup resolved or cancelled every queued frame, so these finish
+    # promptly; let finished batches publish before NATS goes away
+    if pending_results:
+        await asyncio.gather(*pending_results, return_exceptions=True)
+    
     if nats_client:
         await nats_client.disconnect()
     
     logger.info("Pose detection worker stopped")
 
 
-async def handle_pose_detection(msg: Dict[str, Any]) -> None:
-    """Handle pose detection requests from NATS."""
+async def handle_pose_detection(data: bytes, headers: Dict[str, str]) -> None:
+    """Handle pose detection requests from NATS.
+    
+    Frames arrive either as the encoded image itself (``Content-Type:
+    image/jpeg`` or ``image/png``, with ``Session-Id`` and ``Timestamp``
+    headers) or as a JSON message carrying base64 ``frame_data``.
+    
+    Results carry keypoints as ``keypoints_xyzv`` rows; senders that still
+    need the name-keyed ``keypoints`` dict set ``legacy_kp_format`` (or the
+    ``Legacy-Kp-Format`` header for binary frames).
+    """
     try:
-        # Extract frame data from message
-        frame_data = msg.get("frame_data")
-        session_id = msg.get("session_id")
-        timestamp = msg.get("timestamp")
+        if headers.get("Content-Type", "").startswith("image/"):
+            # Binary frame: no JSON or base64 decoding needed
+            frame_data = {"image_data": data}
+            session_id = headers.get("Session-Id")
+            timestamp = float(headers["Timestamp"]) if "Timestamp" in headers else None
+            legacy = "Legacy-Kp-Format" in headers
+        else:
+            # Extract frame data from message
+            msg = decode_message(data)
+            frame_data = msg.get("frame_data")
+            session_id = msg.get("session_id")
+            timestamp = msg.get("timestamp")
+            legacy = bool(msg.get("legacy_kp_format"))
         
         if not frame_data:
             logger.warning("No frame data in pose detection request")
             return
         
-        # Process pose detection
-        result = await pose_detector.detect_pose(frame_data)
+        # Queue the frame for batched detection and return to the
+        # subscription; the result is published when the batch completes
+        future = await pose_detector.submit(frame_data)
+        task = asyncio.create_task(publish_pose_result(future, session_id, timestamp, legacy))
+        pending_results.add(task)
+        task.add_done_callback(pending_results.discard)
+        
+    except Exception as e:
+        logger.error(f"Error processing pose detection: {e}")
+
+
+async def publish_pose_result(
+    future: asyncio.Future, session_id: str, timestamp: Any, legacy: bool = False
+) -> None:
+    """Publish a pose result once its batch has been processed."""
+    try:
+        # wait() returns rather than raising when the frame is dropped, so
+        # only cancellation of this task itself propagates
+        await asyncio.wait((future,))
+        if future.cancelled():
+            return  # Frame dropped as stale; nothing to publish
+        
+        result = future.result()
+        if legacy:
+            result = with_keypoint_dict(result)
         
         # Publish results
         response = {
@@ -94,7 +154,7 @@ async def handle_pose_detection(msg: Dict[str, Any]) -> None:
         await nats_client.publish("pose.result", response)
         
     except Exception as e:
-        logger.error(f"Error processing pose detection: {e}")
+        logger.error(f"Error publishing pose result: {e}")
 
 
 @app.get("/health")
@@ -103,7 +163,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "pose-detection-worker",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "frames_dropped": pose_detector.frames_dropped if pose_detector else 0,
     }
 
 
@@ -111,8 +172,10 @@ async def health_check():
 async def detect_pose_endpoint(frame_data: Dict[str, Any]):
     """HTTP endpoint for pose detection (for testing)."""
     try:
+        # Detect directly: test calls must not be dropped by the NATS
+        # frame inbox under load
         result = await pose_detector.detect_pose(frame_data)
-        return {"success": True, "pose_data": result}
+        return {"success": True, "pose_data": with_keypoint_dict(result)}
     except Exception as e:
         logger.error(f"Error in pose detection endpoint: {e}")
         return {"success": False, "error": str(e)}
@@ -125,6 +188,8 @@ def main():
         "workers.pose.main:app",
         host="0.0.0.0",
         port=settings.pose_worker_port,
+        loop="uvloop",
+        http="httptools",
         reload=settings.debug,
         log_level="info" if not settings.debug else "debug",
     )
@@ -1,8 +1,13 @@
 """Pose detection implementation using MediaPipe."""
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 import numpy as np
 import cv2
 import base64
@@ -13,26 +18,161 @@ logger = logging.getLogger(__name__)
 
 try:
     import mediapipe as mp
+    from mediapipe.tasks import python as mp_tasks
+    from mediapipe.tasks.python import vision as mp_vision
     MEDIAPIPE_AVAILABLE = True
 except ImportError:
     MEDIAPIPE_AVAILABLE = False
     logger.warning("MediaPipe not available, using mock pose detector")
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# MediaPipe pose landmark names, in landmark index order
+LANDMARK_NAMES = (
+    "nose", "left_eye_inner", "left_eye", "left_eye_outer",
+    "right_eye_inner", "right_eye", "right_eye_outer",
+    "left_ear", "right_ear", "mouth_left", "mouth_right",
+    "left_shoulder", "right_shoulder", "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist", "left_pinky", "right_pinky",
+    "left_index", "right_index", "left_thumb", "right_thumb",
+    "left_hip", "right_hip", "left_knee", "right_knee",
+    "left_ankle", "right_ankle", "left_heel", "right_heel",
+    "left_foot_index", "right_foot_index",
+)
+
+# Mock detector base positions (normalized x, y, z), in LANDMARK_NAMES order
+_MOCK_KEYPOINTS = np.array([
+    (0.5, 0.3, 0.0),  # nose
+    (0.48, 0.28, 0.0),  # left_eye_inner
+    (0.47, 0.28, 0.0),  # left_eye
+    (0.46, 0.28, 0.0),  # left_eye_outer
+    (0.52, 0.28, 0.0),  # right_eye_inner
+    (0.53, 0.28, 0.0),  # right_eye
+    (0.54, 0.28, 0.0),  # right_eye_outer
+    (0.44, 0.3, 0.0),  # left_ear
+    (0.56, 0.3, 0.0),  # right_ear
+    (0.48, 0.32, 0.0),  # mouth_left
+    (0.52, 0.32, 0.0),  # mouth_right
+    (0.4, 0.45, 0.0),  # left_shoulder
+    (0.6, 0.45, 0.0),  # right_shoulder
+    (0.35, 0.6, 0.0),  # left_elbow
+    (0.65, 0.6, 0.0),  # right_elbow
+    (0.3, 0.75, 0.0),  # left_wrist
+    (0.7, 0.75, 0.0),  # right_wrist
+    (0.28, 0.77, 0.0),  # left_pinky
+    (0.72, 0.77, 0.0),  # right_pinky
+    (0.29, 0.78, 0.0),  # left_index
+    (0.71, 0.78, 0.0),  # right_index
+    (0.31, 0.76, 0.0),  # left_thumb
+    (0.69, 0.76, 0.0),  # right_thumb
+    (0.42, 0.8, 0.0),  # left_hip
+    (0.58, 0.8, 0.0),  # right_hip
+    (0.4, 1.1, 0.0),  # left_knee
+    (0.6, 1.1, 0.0),  # right_knee
+    (0.38, 1.4, 0.0),  # left_ankle
+    (0.62, 1.4, 0.0),  # right_ankle
+    (0.36, 1.42, 0.0),  # left_heel
+    (0.64, 1.42, 0.0),  # right_heel
+    (0.39, 1.45, 0.0),  # left_foot_index
+    (0.61, 1.45, 0.0),  # right_foot_index
+])
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Results for this many distinct encoded frames are kept, keyed by content
+POSE_CACHE_SIZE = 128
+
+# Inference and decode threads, roughly one per physical core
+POSE_THREADS = max(1, (os.cpu_count() or 2) // 2)
+
+# Dynamic batching: the scheduler takes up to POSE_BATCH_SIZE queued frames,
+# waiting at most POSE_BATCH_WAIT seconds to fill a batch. When inference
+# falls behind, a full inbox drops its oldest frame for the newest, and
+# frames queued longer than POSE_MAX_FRAME_AGE seconds are skipped, so
+# latency stays bounded instead of growing with the backlog.
+POSE_BATCH_SIZE = 8
+POSE_BATCH_WAIT = 0.01
+POSE_INBOX_SIZE = 32
+POSE_MAX_FRAME_AGE = 0.1
+
+# JPEG SOI marker; such frames go through libjpeg-turbo, anything else via PIL
+_JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+def _frame_digest(data: bytes) -> Any:
+    """Content hash of an encoded frame, used as the result cache key."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def with_keypoint_dict(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return ``result`` with its keypoint array replaced by the legacy dict form.
+    
+    Detection results carry ``keypoints_xyzv``, an (n, 4) float32 array of
+    x, y, z and visibility rows in ``LANDMARK_NAMES`` order. Older consumers
+    expect ``keypoints`` as a name -> {x, y, z, visibility} mapping.
+    """
+    coords = result.get("keypoints_xyzv") if result else None
+    if coords is None:
+        return result
+    
+    converted = {key: value for key, value in result.items() if key != "keypoints_xyzv"}
+    converted["keypoints"] = {
+        name: {"x": x, "y": y, "z": z, "visibility": visibility}
+        for name, (x, y, z, visibility) in zip(LANDMARK_NAMES, coords.tolist())
+    }
+    return converted
+
 
 class PoseDetector:
     """Pose detection using MediaPipe or mock implementation."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        model_complexity: int = 1,
+        landmarker_model_path: Optional[str] = None,
+    ):
         self.is_initialized = False
         self.mp_pose = None
         self.pose = None
         self.mp_drawing = None
         self.mp_drawing_styles = None
+        self.jpeg_decoder = None
+        
+        # MediaPipe graphs are not thread-safe, so each executor thread runs
+        # its own Pose instance
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._poses: List[Any] = []
+        self._poses_lock = threading.Lock()
+        
+        # Pose results for recently seen encoded frames, in LRU order
+        self._result_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        
+        # Batching scheduler, started in initialize
+        self._inbox: Optional[asyncio.Queue] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        self.frames_dropped = 0
         
         # Performance settings
         self.min_detection_confidence = 0.7
         self.min_tracking_confidence = 0.5
-        self.model_complexity = 1  # 0, 1, or 2
+        self.model_complexity = model_complexity  # 0 (lite), 1 (full) or 2 (heavy)
+        # When set, inference uses the Tasks PoseLandmarker with this .tflite
+        # model (e.g. an INT8-quantized lite model) instead of solutions.pose
+        self.landmarker_model_path = landmarker_model_path
+        
+        # Noise source for the mock detector
+        self._rng = np.random.default_rng()
         
         # Frame processing
         self.frame_count = 0
@@ -46,24 +186,150 @@ class PoseDetector:
                 self.mp_drawing = mp.solutions.drawing_utils
                 self.mp_drawing_styles = mp.solutions.drawing_styles
                 
-                self.pose = self.mp_pose.Pose(
-                    static_image_mode=False,
-                    model_complexity=self.model_complexity,
-                    enable_segmentation=False,
-                    min_detection_confidence=self.min_detection_confidence,
-                    min_tracking_confidence=self.min_tracking_confidence
-                )
+                self.pose = self._create_pose()
                 
-                logger.info("MediaPipe pose detector initialized")
+                logger.info(
+                    f"MediaPipe pose detector initialized "
+                    f"({self.landmarker_model_path or f'complexity {self.model_complexity}'})"
+                )
             else:
                 logger.info("Using mock pose detector")
             
+            if TURBOJPEG_AVAILABLE:
+                try:
+                    self.jpeg_decoder = TurboJPEG()
+                except (OSError, RuntimeError) as e:
+                    # The wrapper is installed but libjpeg-turbo is not
+                    logger.warning(f"TurboJPEG unavailable, decoding JPEG with PIL: {e}")
+            
+            self.executor = ThreadPoolExecutor(max_workers=POSE_THREADS, thread_name_prefix="pose")
+            self._inbox = asyncio.Queue(maxsize=POSE_INBOX_SIZE)
+            self._scheduler = asyncio.create_task(self._run_scheduler())
             self.is_initialized = True
             
         except Exception as e:
             logger.error(f"Failed to initialize pose detector: {e}")
             raise
 
+    def _create_pose(self) -> Any:
+        """Build a MediaPipe Pose graph with the detector settings."""
+        if self.landmarker_model_path:
+            options = mp_vision.PoseLandmarkerOptions(
+                base_options=mp_tasks.BaseOptions(
+                    model_asset_path=self.landmarker_model_path,
+                    delegate=mp_tasks.BaseOptions.Delegate.CPU,
+                ),
+                # VIDEO mode needs increasing timestamps per instance, which
+                # frames from many sessions on shared instances cannot give
+                running_mode=mp_vision.RunningMode.IMAGE,
+                num_poses=1,
+                min_pose_detection_confidence=self.min_detection_confidence,
+                min_tracking_confidence=self.min_tracking_confidence,
+            )
+            return mp_vision.PoseLandmarker.create_from_options(options)
+        
+        return self.mp_pose.Pose(
+            static_image_mode=False,
+            model_complexity=self.model_complexity,
+            enable_segmentation=False,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence
+        )
+
+    def _thread_pose(self) -> Any:
+        """Return the calling thread's Pose instance, creating it on first use."""
+        pose = getattr(self._local, "pose", None)
+        if pose is None:
+            with self._poses_lock:
+                # The first thread adopts the instance built in initialize
+                pose = self.pose if not self._poses else self._create_pose()
+                self._poses.append(pose)
+            self._local.pose = pose
+        return pose
+
+    def _process_image(self, image: np.ndarray) -> Optional[Sequence[Any]]:
+        """Run MediaPipe on an executor thread, returning the pose landmarks."""
+        model = self._thread_pose()
+        if self.landmarker_model_path:
+            result = model.detect(mp.Image(image_format=mp.ImageFormat.SRGB, data=image))
+            return result.pose_landmarks[0] if result.pose_landmarks else None
+        
+        results = model.process(image)
+        return results.pose_landmarks.landmark if results.pose_landmarks else None
+
+    async def submit(self, frame_data: Dict[str, Any]) -> asyncio.Future:
+        """Queue a frame for batched detection.
+        
+        Returns a future that resolves to the ``detect_pose`` result, so
+        callers can accept the next frame while this one is processed. The
+        future is cancelled if the frame is dropped as stale.
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        loop = asyncio.get_running_loop()
+        if self._inbox.full():
+            _, stale, _ = self._inbox.get_nowait()
+            stale.cancel()
+            self.frames_dropped += 1
+        
+        future = loop.create_future()
+        self._inbox.put_nowait((frame_data, future, loop.time()))
+        return future
+
+    async def _next_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future, float]]:
+        """Wait for a frame, then collect more until the batch fills or times out."""
+        batch = [await self._inbox.get()]
+        while len(batch) < POSE_BATCH_SIZE and not self._inbox.empty():
+            batch.append(self._inbox.get_nowait())
+        
+        if len(batch) < POSE_BATCH_SIZE:
+            try:
+                await asyncio.sleep(POSE_BATCH_WAIT)
+            except asyncio.CancelledError:
+                # Frames already off the queue would otherwise never resolve
+                for _, future, _ in batch:
+                    future.cancel()
+                raise
+            while len(batch) < POSE_BATCH_SIZE and not self._inbox.empty():
+                batch.append(self._inbox.get_nowait())
+        
+        return batch
+
+    async def _run_scheduler(self) -> None:
+        """Process queued frames a batch at a time."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            frames = await self._next_batch()
+            # Age is measured once the batch is assembled, so time spent
+            # waiting for it to fill counts against the frame
+            now = loop.time()
+            for frame_data, future, received_at in frames:
+                if now - received_at > POSE_MAX_FRAME_AGE:
+                    future.cancel()
+                    self.frames_dropped += 1
+                else:
+                    batch.append((frame_data, future))
+            
+            try:
+                results = await asyncio.gather(
+                    *(self.detect_pose(frame_data) for frame_data, _ in batch),
+                    return_exceptions=True,
+                )
+            except asyncio.CancelledError:
+                # Shutting down mid-batch; release the callers waiting on it
+                for _, future in batch:
+                    future.cancel()
+                raise
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
     async def detect_pose(self, frame_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Detect pose in frame data."""
         if not self.is_initialized:
@@ -75,40 +341,66 @@ class PoseDetector:
             if self.frame_count % (self.skip_frames + 1) != 0:
                 return None
             
+            # Byte-identical encoded frames (client retries, held poses)
+            # reuse the earlier result; raw pixel payloads are not cached
+            image_bytes = self._encoded_image(frame_data)
+            if image_bytes is not None:
+                key = _frame_digest(image_bytes)
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+                    return cached
+            
             # Decode frame data
-            image = await self._decode_frame(frame_data)
+            image = await self._decode_frame(frame_data, image_bytes)
             if image is None:
                 return None
             
             # Detect pose
             if MEDIAPIPE_AVAILABLE and self.pose:
-                return await self._detect_with_mediapipe(image)
+                result = await self._detect_with_mediapipe(image)
             else:
-                return await self._detect_with_mock(image)
+                result = await self._detect_with_mock(image)
+            
+            if image_bytes is not None and "error" not in result:
+                self._result_cache[key] = result
+                if len(self._result_cache) > POSE_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            
+            return result
                 
         except Exception as e:
             logger.error(f"Error detecting pose: {e}")
             return None
 
-    async def _decode_frame(self, frame_data: Dict[str, Any]) -> Optional[np.ndarray]:
-        """Decode frame data to numpy array."""
+    def _encoded_image(self, frame_data: Dict[str, Any]) -> Optional[bytes]:
+        """Return the encoded image bytes of an ``image_data`` frame, if any."""
+        # Base64 encoded image, or the encoded bytes themselves
+        image_data = frame_data.get("image_data")
+        if isinstance(image_data, str):
+            # Remove data URL prefix if present
+            if image_data.startswith("data:image"):
+                image_data = image_data.partition(",")[2]
+            
+            # Decode base64
+            return base64.b64decode(image_data)
+        if isinstance(image_data, (bytes, bytearray)):
+            return image_data
+        return None
+
+    async def _decode_frame(
+        self, frame_data: Dict[str, Any], image_bytes: Optional[bytes] = None
+    ) -> Optional[np.ndarray]:
+        """Decode frame data to an RGB numpy array.
+        
+        ``image_bytes`` are the frame's encoded image from ``_encoded_image``;
+        without them the frame must carry raw pixel data.
+        """
         try:
             # Handle different frame data formats
-            if "image_data" in frame_data:
-                # Base64 encoded image
-                image_b64 = frame_data["image_data"]
-                if isinstance(image_b64, str):
-                    # Remove data URL prefix if present
-                    if image_b64.startswith("data:image"):
-                        image_b64 = image_b64.split(",")[1]
-                    
-                    # Decode base64
-                    image_bytes = base64.b64decode(image_b64)
-                    image = Image.open(BytesIO(image_bytes))
-                    
-                    # Convert to RGB numpy array
-                    image_rgb = np.array(image.convert("RGB"))
-                    return image_rgb
+            if image_bytes is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, self._decode_image, image_bytes)
             
             elif "width" in frame_data and "height" in frame_data and "data" in frame_data:
                 # Raw pixel data
@@ -139,55 +431,53 @@ class PoseDetector:
             logger.error(f"Error decoding frame: {e}")
             return None
 
+    def _decode_image(self, image_bytes: bytes) -> np.ndarray:
+        """Decode compressed image bytes to an RGB numpy array."""
+        if self.jpeg_decoder is not None and image_bytes[:3] == _JPEG_MAGIC:
+            # SIMD IDCT and colour conversion in libjpeg-turbo
+            return self.jpeg_decoder.decode(image_bytes, pixel_format=TJPF_RGB)
+        
+        # One C call straight from the payload buffer, then an in-place
+        # channel swap: a single full-frame allocation per decode. Buffers
+        # are not reused across frames since batched frames are in flight
+        # on several threads at once.
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if image is not None:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+        
+        # Formats OpenCV was built without
+        image = Image.open(BytesIO(image_bytes))
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return np.array(image)
+
     async def _detect_with_mediapipe(self, image: np.ndarray) -> Dict[str, Any]:
         """Detect pose using MediaPipe."""
         try:
-            # Convert BGR to RGB (MediaPipe expects RGB)
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB) if len(image.shape) == 3 else image
+            # _decode_frame always yields RGB, which is what MediaPipe expects.
+            # The blocking graph call runs off the event loop.
+            loop = asyncio.get_running_loop()
+            landmarks = await loop.run_in_executor(self.executor, self._process_image, image)
             
-            # Process image
-            results = self.pose.process(image_rgb)
-            
-            if not results.pose_landmarks:
+            if not landmarks:
                 return {
                     "keypoints": {},
                     "confidence": 0.0,
                     "landmarks_detected": False
                 }
             
-            # Extract keypoints
-            keypoints = {}
-            landmarks = results.pose_landmarks.landmark
-            
-            # MediaPipe pose landmark indices
-            landmark_names = [
-                "nose", "left_eye_inner", "left_eye", "left_eye_outer",
-                "right_eye_inner", "right_eye", "right_eye_outer",
-                "left_ear", "right_ear", "mouth_left", "mouth_right",
-                "left_shoulder", "right_shoulder", "left_elbow", "right_elbow",
-                "left_wrist", "right_wrist", "left_pinky", "right_pinky",
-                "left_index", "right_index", "left_thumb", "right_thumb",
-                "left_hip", "right_hip", "left_knee", "right_knee",
-                "left_ankle", "right_ankle", "left_heel", "right_heel",
-                "left_foot_index", "right_foot_index"
-            ]
-            
-            # Convert landmarks to keypoints
-            for i, name in enumerate(landmark_names):
-                if i < len(landmarks):
-                    landmark = landmarks[i]
-                    keypoints[name] = {
-                        "x": landmark.x,
-                        "y": landmark.y,
-                        "z": landmark.z,
-                        "visibility": landmark.visibility
-                    }
+            # One pass over the landmarks into an (n, 4) array
+            coords = np.array(
+                [(lm.x, lm.y, lm.z, lm.visibility) for lm in landmarks],
+                dtype=np.float32,
+            )
             
             # Calculate overall confidence
-            confidence = np.mean([lm.visibility for lm in landmarks])
+            confidence = coords[:, 3].mean(dtype=np.float64)
             
+            # Landmarks beyond the named 33 are ignored
             return {
-                "keypoints": keypoints,
+                "keypoints_xyzv": coords[:len(LANDMARK_NAMES)],
                 "confidence": float(confidence),
                 "landmarks_detected": True,
                 "num_landmarks": len(landmarks)
@@ -208,58 +498,17 @@ class PoseDetector:
             # Generate mock keypoints with some variation
             height, width = image.shape[:2]
             
-            # Base positions (normalized coordinates)
-            base_keypoints = {
-                "nose": {"x": 0.5, "y": 0.3, "z": 0.0},
-                "left_eye_inner": {"x": 0.48, "y": 0.28, "z": 0.0},
-                "left_eye": {"x": 0.47, "y": 0.28, "z": 0.0},
-                "left_eye_outer": {"x": 0.46, "y": 0.28, "z": 0.0},
-                "right_eye_inner": {"x": 0.52, "y": 0.28, "z": 0.0},
-                "right_eye": {"x": 0.53, "y": 0.28, "z": 0.0},
-                "right_eye_outer": {"x": 0.54, "y": 0.28, "z": 0.0},
-                "left_ear": {"x": 0.44, "y": 0.3, "z": 0.0},
-                "right_ear": {"x": 0.56, "y": 0.3, "z": 0.0},
-                "mouth_left": {"x": 0.48, "y": 0.32, "z": 0.0},
-                "mouth_right": {"x": 0.52, "y": 0.32, "z": 0.0},
-                "left_shoulder": {"x": 0.4, "y": 0.45, "z": 0.0},
-                "right_shoulder": {"x": 0.6, "y": 0.45, "z": 0.0},
-                "left_elbow": {"x": 0.35, "y": 0.6, "z": 0.0},
-                "right_elbow": {"x": 0.65, "y": 0.6, "z": 0.0},
-                "left_wrist": {"x": 0.3, "y": 0.75, "z": 0.0},
-                "right_wrist": {"x": 0.7, "y": 0.75, "z": 0.0},
-                "left_pinky": {"x": 0.28, "y": 0.77, "z": 0.0},
-                "right_pinky": {"x": 0.72, "y": 0.77, "z": 0.0},
-                "left_index": {"x": 0.29, "y": 0.78, "z": 0.0},
-                "right_index": {"x": 0.71, "y": 0.78, "z": 0.0},
-                "left_thumb": {"x": 0.31, "y": 0.76, "z": 0.0},
-                "right_thumb": {"x": 0.69, "y": 0.76, "z": 0.0},
-                "left_hip": {"x": 0.42, "y": 0.8, "z": 0.0},
-                "right_hip": {"x": 0.58, "y": 0.8, "z": 0.0},
-                "left_knee": {"x": 0.4, "y": 1.1, "z": 0.0},
-                "right_knee": {"x": 0.6, "y": 1.1, "z": 0.0},
-                "left_ankle": {"x": 0.38, "y": 1.4, "z": 0.0},
-                "right_ankle": {"x": 0.62, "y": 1.4, "z": 0.0},
-                "left_heel": {"x": 0.36, "y": 1.42, "z": 0.0},
-                "right_heel": {"x": 0.64, "y": 1.42, "z": 0.0},
-                "left_foot_index": {"x": 0.39, "y": 1.45, "z": 0.0},
-                "right_foot_index": {"x": 0.61, "y": 1.45, "z": 0.0},
-            }
-            
-            # Add some random variation
-            keypoints = {}
-            for name, point in base_keypoints.items():
-                variation = 0.02  # 2% variation
-                keypoints[name] = {
-                    "x": point["x"] + np.random.uniform(-variation, variation),
-                    "y": point["y"] + np.random.uniform(-variation, variation),
-                    "z": point["z"] + np.random.uniform(-variation/2, variation/2),
-                    "visibility": np.random.uniform(0.8, 1.0)
-                }
+            # Base positions plus up to 2% noise (half that in depth)
+            coords = np.empty((len(LANDMARK_NAMES), 4), dtype=np.float32)
+            noise = self._rng.uniform(-0.02, 0.02, size=_MOCK_KEYPOINTS.shape)
+            noise[:, 2] *= 0.5
+            coords[:, :3] = _MOCK_KEYPOINTS + noise
+            coords[:, 3] = self._rng.uniform(0.8, 1.0, size=len(LANDMARK_NAMES))
             
-            confidence = np.random.uniform(0.85, 0.95)
+            confidence = self._rng.uniform(0.85, 0.95)
             
             return {
-                "keypoints": keypoints,
+                "keypoints_xyzv": coords,
                 "confidence": float(confidence),
                 "landmarks_detected": True,
                 "mock": True
@@ -277,8 +526,28 @@ class PoseDetector:
     async def cleanup(self) -> None:
         """Cleanup resources."""
         try:
-            if self.pose:
-                self.pose.close()
+            if self._scheduler:
+                # Wait for the cancellation to land so the in-flight batch
+                # has released its futures before the inbox is drained
+                self._scheduler.cancel()
+                try:
+                    await self._scheduler
+                except asyncio.CancelledError:
+                    pass
+                self._scheduler = None
+                while not self._inbox.empty():
+                    _, future, _ = self._inbox.get_nowait()
+                    future.cancel()
+            if self.executor:
+                # Running inferences must finish before their graphs are
+                # closed below; wait for them off the event loop
+                await asyncio.to_thread(self.executor.shutdown, wait=True)
+                self.executor = None
+            for pose in self._poses or ([self.pose] if self.pose else []):
+                pose.close()
+            self._poses = []
+            self.pose = None
+            self._result_cache.clear()
             self.is_initialized = False
             logger.info("Pose detector cleaned up")
         except Exception as e:
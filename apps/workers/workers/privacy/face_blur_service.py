@@ -1,8 +1,15 @@
 """Face blur service for privacy protection."""
 
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Any, Tuple, Union
 import numpy as np
 import cv2
 import base64
@@ -11,6 +18,46 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Kernel size from which two box blurs replace the true Gaussian
+BOX_BLUR_MIN_KERNEL = 15
+
+# Decode, detection, blur and encode all release the GIL, so frames of a
+# stream overlap across cores
+BLUR_THREADS = os.cpu_count() or 1
+
+# Face boxes are (n, 4) int32 rows of x, y, width, height in pixels
+_NO_FACES = np.empty((0, 4), dtype=np.int32)
+_NO_FACES.flags.writeable = False
+
+# Frames between detections reuse the last boxes, grown by this fraction
+# per side, unless the scene has changed
+REUSE_PADDING = 0.1
+# Mean absolute difference (0-255) between tiny thumbnails that counts as
+# a scene change and forces detection
+SCENE_CHANGE_THRESHOLD = 12.0
+_THUMB_SIZE = (32, 24)
+# Streams whose last detection is kept for reuse, least recently used
+# evicted first
+MAX_TRACKED_STREAMS = 256
+
+# JPEG SOI marker, raw and as the start of its base64 text
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_JPEG_BASE64_MAGIC = "/9j/"
+_JPEG_DATA_URL = "data:image/jpeg;base64,"
+
+# Per-face kernel sizes: each face's kernel scales with its size and snaps
+# to one of these, so few distinct filters are ever built
+_KERNEL_SIZES = (9, 15, 21, 31, 51, 75, 101)
+
+# Largest kernel OpenCV's CUDA separable filters accept
+CUDA_MAX_KERNEL = 31
+
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    # OpenCV built without the cuda module
+    CUDA_AVAILABLE = False
+
 try:
     import mediapipe as mp
     MEDIAPIPE_AVAILABLE = True
@@ -18,72 +65,221 @@ except ImportError:
     MEDIAPIPE_AVAILABLE = False
     logger.warning("MediaPipe not available, using mock face detection")
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_RGBA
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+
+def _gaussian_sigma(kernel_size: int) -> float:
+    """OpenCV's default Gaussian sigma for ``kernel_size``."""
+    return 0.3 * ((kernel_size - 1) * 0.5 - 1) + 0.8
+
+
+@functools.lru_cache(maxsize=None)
+def _box_blur_size(kernel_size: int) -> int:
+    """Box width whose double pass matches a Gaussian of ``kernel_size``.
+    
+    Two box passes of width w have variance (w^2 - 1) / 6.
+    """
+    sigma = _gaussian_sigma(kernel_size)
+    return max(1, int(round(math.sqrt(6 * sigma * sigma + 1))))
+
+
+def _pad_boxes(boxes: np.ndarray, padding: float, width: int, height: int) -> np.ndarray:
+    """Grow boxes by ``padding`` of their size on each side, clamped to the frame."""
+    pad = (boxes[:, 2:] * padding).astype(np.int32)
+    padded = np.empty_like(boxes)
+    padded[:, :2] = np.maximum(boxes[:, :2] - pad, 0)
+    padded[:, 2:] = np.minimum((width, height) - padded[:, :2], boxes[:, 2:] + 2 * pad)
+    return padded
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """Last detection of one stream, reused for the frames in between."""
+    frame_counter: int = 0
+    boxes: np.ndarray = field(default_factory=lambda: _NO_FACES)
+    shape: Optional[Tuple[int, ...]] = None
+    thumb: Optional[np.ndarray] = None
+
 
 class FaceBlurService:
     """Service for detecting and blurring faces in video frames."""
     
-    def __init__(self):
+    def __init__(self, encode_base64: bool = True, passthrough_clean_frames: bool = False):
         self.is_initialized = False
+        # False returns blurred frames as raw JPEG bytes for transports
+        # that carry binary payloads
+        self.encode_base64 = encode_base64
+        # True echoes JPEG input back unchanged when no face is found,
+        # skipping the re-encode. Off by default: the original file keeps
+        # its metadata (EXIF, possibly location), which re-encoding drops.
+        self.passthrough_clean_frames = passthrough_clean_frames
         self.mp_face_detection = None
         self.face_detection = None
         
         # Privacy settings
-        self.blur_strength = 51  # Gaussian blur kernel size (must be odd)
+        self.blur_strength = 51  # Largest Gaussian blur kernel size (must be odd)
         self.detection_confidence = 0.7
         self.face_padding = 0.2  # Extra padding around detected face
         
         # Performance settings
         self.max_faces = 5
         self.process_scale = 0.5  # Scale down for faster processing
+        self.detect_stride = 3  # Run detection on every Nth frame
+        self.use_cuda = CUDA_AVAILABLE
+        self.jpeg_encoder = None
+        
+        # Randomness for the mock detector; Generator draws are thread-safe
+        self._rng = np.random.default_rng()
+        
+        # MediaPipe graphs are not thread-safe, so each executor thread runs
+        # its own FaceDetection instance
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._detectors: List[Any] = []  # Open per-thread instances
+        self._detector_version = 0  # Bumped when settings invalidate them
+        self._detectors_lock = threading.Lock()
+        self._init_lock = asyncio.Lock()
+        
+        # Last detection per stream, reused for the frames in between
+        self._streams: "OrderedDict[Hashable, _StreamState]" = OrderedDict()
+        self._track_lock = threading.Lock()
         
     async def initialize(self) -> None:
         """Initialize the face detection model."""
         try:
+            self._reset_detectors()
+            
             if MEDIAPIPE_AVAILABLE:
                 self.mp_face_detection = mp.solutions.face_detection
-                self.face_detection = self.mp_face_detection.FaceDetection(
-                    model_selection=0,  # 0 for short-range (< 2m), 1 for full-range
-                    min_detection_confidence=self.detection_confidence
-                )
+                self.face_detection = self._create_face_detection()
                 logger.info("MediaPipe face detection initialized")
             else:
                 logger.info("Using mock face detection")
             
+            if TURBOJPEG_AVAILABLE and self.jpeg_encoder is None:
+                try:
+                    self.jpeg_encoder = TurboJPEG()
+                except (OSError, RuntimeError) as e:
+                    # The wrapper is installed but libjpeg-turbo is not
+                    logger.warning(f"TurboJPEG unavailable, encoding JPEG with OpenCV: {e}")
+            
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=BLUR_THREADS, thread_name_prefix="face-blur")
+            
             self.is_initialized = True
             
         except Exception as e:
             logger.error(f"Failed to initialize face detection: {e}")
             raise
 
-    async def blur_faces_in_frame(self, frame_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Detect and blur faces in a video frame."""
+    def _create_face_detection(self) -> Any:
+        """Build a FaceDetection instance with the current settings."""
+        return self.mp_face_detection.FaceDetection(
+            model_selection=0,  # 0 for short-range (< 2m), 1 for full-range
+            min_detection_confidence=self.detection_confidence
+        )
+
+    def _reset_detectors(self) -> None:
+        """Retire every thread's FaceDetection so each builds a new one on next use.
+        
+        A thread may be mid-``process()`` on its instance, so each thread
+        closes its own stale one when replacing it.
+        """
+        with self._detectors_lock:
+            self._detector_version += 1
+            unused = self.face_detection
+            if unused is not None and unused in self._detectors:
+                unused = None  # Adopted by a thread, which will close it
+            self.face_detection = None
+        if unused is not None:
+            unused.close()
+
+    def _thread_face_detection(self) -> Any:
+        """Return the calling thread's FaceDetection, creating it on first use."""
+        local = self._local
+        stale = getattr(local, "detector", None)
+        if stale is not None and local.detector_version == self._detector_version:
+            return stale
+        
+        with self._detectors_lock:
+            version = self._detector_version
+            # The first thread adopts the instance built in initialize;
+            # after a reset every thread builds its own off the event loop
+            if self.face_detection is not None and self.face_detection not in self._detectors:
+                detector = self.face_detection
+            else:
+                detector = self._create_face_detection()
+            self._detectors.append(detector)
+            if stale is not None:
+                self._detectors.remove(stale)
+        if stale is not None:
+            stale.close()
+        
+        local.detector = detector
+        local.detector_version = version
+        return detector
+
+    async def blur_faces_in_frame(
+        self, frame_data: Dict[str, Any], stream_id: Optional[Hashable] = None
+    ) -> Dict[str, Any]:
+        """Detect and blur faces in a video frame.
+        
+        Raw ``data`` arrays are blurred in place; encoded images are decoded
+        into a new buffer first. Frames of one stream (``stream_id``, else the
+        frame's ``session_id``) share detections; frames of no known stream
+        are always detected.
+        """
         if not self.is_initialized:
-            await self.initialize()
+            async with self._init_lock:
+                if not self.is_initialized:
+                    await self.initialize()
         
+        loop = asyncio.get_running_loop()
+        if stream_id is None:
+            stream_id = frame_data.get("session_id")
+        return await loop.run_in_executor(self.executor, self._blur_frame_sync, frame_data, stream_id)
+
+    def _blur_frame_sync(
+        self, frame_data: Dict[str, Any], stream_id: Optional[Hashable] = None
+    ) -> Dict[str, Any]:
+        """Decode, detect, blur and encode one frame on an executor thread."""
         try:
             # Decode frame
-            image = await self._decode_frame(frame_data)
+            image = self._decode_frame(frame_data)
             if image is None:
                 return {
                     'success': False,
                     'error': 'Failed to decode frame'
                 }
             
+            # With CUDA the frame is uploaded once; detection downloads
+            # only the scaled frame and blurring only the face regions
+            gpu_image = self._upload_frame(image) if self.use_cuda else None
+            
             # Detect faces
-            faces = await self._detect_faces(image)
+            boxes = self._faces_for_frame(image, gpu_image, stream_id)
             
-            # Blur faces
-            blurred_image = await self._blur_faces(image, faces)
+            frame_out = None
+            if not len(boxes) and self.passthrough_clean_frames:
+                frame_out = self._passthrough_frame(frame_data)
             
-            # Encode result
-            result_data = await self._encode_frame(blurred_image)
+            if frame_out is None:
+                # Blur faces
+                blurred_image = self._blur_faces(image, boxes, gpu_image)
+                
+                # Encode result
+                frame_out = self._frame_output(self._encode_frame(blurred_image))
             
             return {
                 'success': True,
-                'blurred_frame': result_data,
-                'faces_detected': len(faces),
-                'faces_blurred': len(faces),
-                'privacy_level': 'high' if len(faces) > 0 else 'none_needed'
+                **frame_out,
+                'faces_detected': len(boxes),
+                'faces_blurred': len(boxes),
+                'privacy_level': 'high' if len(boxes) > 0 else 'none_needed'
             }
             
         except Exception as e:
@@ -93,20 +289,47 @@ class FaceBlurService:
                 'error': str(e)
             }
 
-    async def _decode_frame(self, frame_data: Dict[str, Any]) -> Optional[np.ndarray]:
-        """Decode frame data to numpy array."""
+    def _frame_output(self, jpeg: bytes) -> Dict[str, Any]:
+        """Build the result fields carrying an output JPEG."""
+        if not self.encode_base64:
+            return {'blurred_frame_bytes': jpeg, 'mime': 'image/jpeg'}
+        if not jpeg:
+            return {'blurred_frame': ""}
+        return {'blurred_frame': f"data:image/jpeg;base64,{base64.b64encode(jpeg).decode('ascii')}"}
+
+    def _passthrough_frame(self, frame_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the caller's own JPEG as the output frame, if it sent one."""
+        image_data = frame_data.get("image_data")
+        if isinstance(image_data, str):
+            if image_data.startswith(_JPEG_DATA_URL):
+                if self.encode_base64:
+                    return {'blurred_frame': image_data}
+                return self._frame_output(base64.b64decode(image_data[len(_JPEG_DATA_URL):]))
+            if image_data.startswith(_JPEG_BASE64_MAGIC):
+                if self.encode_base64:
+                    return {'blurred_frame': _JPEG_DATA_URL + image_data}
+                return self._frame_output(base64.b64decode(image_data))
+        elif isinstance(image_data, (bytes, bytearray, memoryview)) and bytes(image_data[:3]) == _JPEG_MAGIC:
+            return self._frame_output(bytes(image_data))
+        return None
+
+    def _decode_frame(self, frame_data: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Decode frame data to an RGB (or, for raw RGBA input, RGBA) numpy array.
+        
+        Raw ``data`` given as bytes, bytearray, memoryview or a uint8 array
+        is reshaped without copying.
+        """
         try:
             if "image_data" in frame_data:
-                # Base64 encoded image
-                image_b64 = frame_data["image_data"]
-                if isinstance(image_b64, str):
-                    if image_b64.startswith("data:image"):
-                        image_b64 = image_b64.split(",")[1]
+                # Base64 encoded image, or the encoded bytes themselves
+                image_data = frame_data["image_data"]
+                if isinstance(image_data, str):
+                    if image_data.startswith("data:image"):
+                        image_data = image_data.partition(",")[2]
                     
-                    image_bytes = base64.b64decode(image_b64)
-                    image = Image.open(BytesIO(image_bytes))
-                    image_rgb = np.array(image.convert("RGB"))
-                    return image_rgb
+                    return self._decode_image(base64.b64decode(image_data))
+                if isinstance(image_data, (bytes, bytearray, memoryview)):
+                    return self._decode_image(image_data)
             
             elif "width" in frame_data and "height" in frame_data and "data" in frame_data:
                 # Raw pixel data
@@ -114,19 +337,27 @@ class FaceBlurService:
                 height = frame_data["height"]
                 data = frame_data["data"]
                 
-                if isinstance(data, list):
-                    data = np.array(data, dtype=np.uint8)
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    # Zero-copy; the preferred form for senders
+                    data = np.frombuffer(data, dtype=np.uint8)
+                else:
+                    # Everything downstream stays on OpenCV's 8-bit paths;
+                    # uint8 arrays pass through without a copy. Lists still
+                    # work but cost one Python object per channel value.
+                    data = np.asarray(data).astype(np.uint8, copy=False)
                 
+                # RGBA stays RGBA: detection strips alpha from the scaled copy
+                # and encoding from the output, so the full frame is never
+                # copied just to drop a channel
                 if len(data) == width * height * 4:  # RGBA
                     image = data.reshape((height, width, 4))
-                    image_rgb = cv2.cvtColor(image, cv2.COLOR_RGBA2RGB)
                 elif len(data) == width * height * 3:  # RGB
-                    image_rgb = data.reshape((height, width, 3))
+                    image = data.reshape((height, width, 3))
                 else:
                     logger.error(f"Unexpected data length: {len(data)} for {width}x{height}")
                     return None
                 
-                return image_rgb
+                return image
             
             return None
             
@@ -134,69 +365,163 @@ class FaceBlurService:
             logger.error(f"Error decoding frame: {e}")
             return None
 
-    async def _detect_faces(self, image: np.ndarray) -> List[Dict[str, Any]]:
-        """Detect faces in the image."""
+    def _decode_image(self, image_bytes: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+        """Decode compressed image bytes to an RGB numpy array."""
+        # Decoded straight from the payload buffer, then swapped in place
+        image = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if image is not None:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+        
+        # Formats OpenCV was built without
+        image = Image.open(BytesIO(image_bytes))
+        return np.array(image.convert("RGB"))
+
+    def _upload_frame(self, image: np.ndarray) -> Optional[Any]:
+        """Upload a frame to the GPU as RGBA, or return None on failure."""
         try:
-            if MEDIAPIPE_AVAILABLE and self.face_detection:
-                return await self._detect_faces_mediapipe(image)
+            gpu_image = cv2.cuda_GpuMat()
+            gpu_image.upload(image)
+            # CUDA filters take one- or four-channel images
+            if image.shape[2] == 3:
+                gpu_image = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGB2RGBA)
+            return gpu_image
+        except cv2.error as e:
+            logger.warning(f"CUDA upload failed, blurring on CPU: {e}")
+            return None
+
+    def _cuda_blur_filter(self, kernel_size: int) -> Tuple[Any, int]:
+        """Return the calling thread's CUDA Gaussian filter and its pass count."""
+        filters = getattr(self._local, "cuda_filters", None)
+        if filters is None:
+            filters = self._local.cuda_filters = {}
+        
+        entry = filters.get(kernel_size)
+        if entry is None:
+            if kernel_size <= CUDA_MAX_KERNEL:
+                size, sigma, passes = kernel_size, 0, 1
             else:
-                return await self._detect_faces_mock(image)
+                # n passes of sigma / sqrt(n) give the requested sigma; n is
+                # chosen so each pass keeps +/-2.5 sigma inside the size limit
+                size = CUDA_MAX_KERNEL
+                target = _gaussian_sigma(kernel_size)
+                passes = math.ceil((target / (CUDA_MAX_KERNEL // 2 / 2.5)) ** 2)
+                sigma = target / math.sqrt(passes)
+            gaussian = cv2.cuda.createGaussianFilter(cv2.CV_8UC4, cv2.CV_8UC4, (size, size), sigma)
+            entry = filters[kernel_size] = (gaussian, passes)
+        return entry
+
+    def _face_kernel_size(self, width: int, height: int) -> int:
+        """Blur kernel size for a face box, capped at ``blur_strength``."""
+        # About a quarter of the face's smaller side, snapped to a known size
+        target = max(_KERNEL_SIZES[0], (min(width, height) // 4) | 1)
+        snapped = min(_KERNEL_SIZES, key=lambda size: abs(size - target))
+        return min(snapped, self.blur_strength)
+
+    def _scratch(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return the calling thread's reusable uint8 buffer for ``name`` and ``shape``."""
+        buffers = getattr(self._local, "scratch", None)
+        if buffers is None:
+            buffers = self._local.scratch = {}
+        
+        # Keyed by shape as well, so several camera resolutions don't thrash
+        key = (name, shape)
+        buffer = buffers.get(key)
+        if buffer is None:
+            buffer = buffers[key] = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def _faces_for_frame(
+        self, image: np.ndarray, gpu_image: Optional[Any] = None, stream_id: Optional[Hashable] = None
+    ) -> np.ndarray:
+        """Detect faces every ``detect_stride`` frames of a stream and reuse boxes in between."""
+        if stream_id is None or self.detect_stride == 1:
+            return self._detect_faces(image, gpu_image)
+        
+        thumb = cv2.resize(image, _THUMB_SIZE, interpolation=cv2.INTER_AREA).astype(np.int16)
+        
+        with self._track_lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                state = self._streams[stream_id] = _StreamState()
+                if len(self._streams) > MAX_TRACKED_STREAMS:
+                    self._streams.popitem(last=False)
+            else:
+                self._streams.move_to_end(stream_id)
+            count = state.frame_counter
+            state.frame_counter += 1
+            last_boxes, last_shape, last_thumb = state.boxes, state.shape, state.thumb
+        
+        if (
+            count % self.detect_stride != 0
+            and last_shape == image.shape
+            and np.abs(thumb - last_thumb).mean() <= SCENE_CHANGE_THRESHOLD
+        ):
+            height, width = image.shape[:2]
+            return _pad_boxes(last_boxes, REUSE_PADDING, width, height)
+        
+        boxes = self._detect_faces(image, gpu_image)
+        with self._track_lock:
+            state.boxes, state.shape, state.thumb = boxes, image.shape, thumb
+        return boxes
+
+    def _detect_faces(self, image: np.ndarray, gpu_image: Optional[Any] = None) -> np.ndarray:
+        """Detect faces in the image, returning an (n, 4) array of boxes."""
+        try:
+            if MEDIAPIPE_AVAILABLE and self.mp_face_detection:
+                return self._detect_faces_mediapipe(image, gpu_image)
+            else:
+                return self._detect_faces_mock(image)
                 
         except Exception as e:
             logger.error(f"Error detecting faces: {e}")
-            return []
+            return _NO_FACES
 
-    async def _detect_faces_mediapipe(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _detect_faces_mediapipe(self, image: np.ndarray, gpu_image: Optional[Any] = None) -> np.ndarray:
         """Detect faces using MediaPipe."""
         try:
             # Scale down for faster processing
             height, width = image.shape[:2]
             scaled_width = int(width * self.process_scale)
             scaled_height = int(height * self.process_scale)
-            scaled_image = cv2.resize(image, (scaled_width, scaled_height))
+            # INTER_AREA averages source pixels, which is both cheaper and
+            # alias-free when shrinking
+            if gpu_image is not None:
+                scaled_image = cv2.cuda.resize(
+                    gpu_image, (scaled_width, scaled_height), interpolation=cv2.INTER_AREA
+                ).download()
+            else:
+                scaled_image = cv2.resize(
+                    image, (scaled_width, scaled_height),
+                    dst=self._scratch("scaled", (scaled_height, scaled_width, image.shape[2])),
+                    interpolation=cv2.INTER_AREA
+                )
+            if scaled_image.shape[2] == 4:
+                scaled_image = cv2.cvtColor(
+                    scaled_image, cv2.COLOR_RGBA2RGB,
+                    dst=self._scratch("scaled_rgb", (scaled_height, scaled_width, 3))
+                )
             
-            # Convert BGR to RGB for MediaPipe
-            rgb_image = cv2.cvtColor(scaled_image, cv2.COLOR_BGR2RGB)
+            # MediaPipe expects RGB in a C-contiguous array and does not keep
+            # it, so the thread's scratch buffers are safe to reuse
+            results = self._thread_face_detection().process(scaled_image)
             
-            # Process image
-            results = self.face_detection.process(rgb_image)
+            if not results.detections:
+                return _NO_FACES
             
-            faces = []
-            if results.detections:
-                for detection in results.detections[:self.max_faces]:
-                    # Get bounding box
-                    bbox = detection.location_data.relative_bounding_box
-                    
-                    # Scale back to original size
-                    x = int(bbox.xmin * width)
-                    y = int(bbox.ymin * height)
-                    w = int(bbox.width * width)
-                    h = int(bbox.height * height)
-                    
-                    # Add padding
-                    padding_x = int(w * self.face_padding)
-                    padding_y = int(h * self.face_padding)
-                    
-                    x = max(0, x - padding_x)
-                    y = max(0, y - padding_y)
-                    w = min(width - x, w + 2 * padding_x)
-                    h = min(height - y, h + 2 * padding_y)
-                    
-                    faces.append({
-                        'x': x,
-                        'y': y,
-                        'width': w,
-                        'height': h,
-                        'confidence': detection.score[0]
-                    })
+            # Relative boxes scaled back to original size (truncating like int())
+            relative = np.array([
+                (bbox.xmin, bbox.ymin, bbox.width, bbox.height)
+                for bbox in (d.location_data.relative_bounding_box for d in results.detections[:self.max_faces])
+            ], dtype=np.float64)
+            boxes = (relative * (width, height, width, height)).astype(np.int32)
             
-            return faces
+            return _pad_boxes(boxes, self.face_padding, width, height)
             
         except Exception as e:
             logger.error(f"Error in MediaPipe face detection: {e}")
-            return []
+            return _NO_FACES
 
-    async def _detect_faces_mock(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _detect_faces_mock(self, image: np.ndarray) -> np.ndarray:
         """Mock face detection for testing."""
         try:
             # Generate mock face detection in center area
@@ -210,83 +535,116 @@ class FaceBlurService:
             face_y = int(height * 0.15)   # Upper portion
             
             # Only return mock face 50% of the time to simulate detection variability
-            import random
-            if random.random() < 0.5:
-                return [{
-                    'x': face_x,
-                    'y': face_y,
-                    'width': face_width,
-                    'height': face_height,
-                    'confidence': 0.85
-                }]
-            
-            return []
+            if self._rng.random() < 0.5:
+                return np.array([(face_x, face_y, face_width, face_height)], dtype=np.int32)
+            
+            return _NO_FACES
             
         except Exception as e:
             logger.error(f"Error in mock face detection: {e}")
-            return []
+            return _NO_FACES
 
-    async def _blur_faces(self, image: np.ndarray, faces: List[Dict[str, Any]]) -> np.ndarray:
-        """Apply blur to detected faces."""
+    def _blur_faces(
+        self, image: np.ndarray, boxes: np.ndarray, gpu_image: Optional[Any] = None
+    ) -> np.ndarray:
+        """Blur detected faces in place and return the image.
+        
+        ``image`` is uint8, as ``_decode_frame`` guarantees. ``gpu_image`` is the frame's RGBA upload; when given, faces are
+        blurred on the GPU and only the blurred regions are downloaded.
+        """
         try:
-            blurred_image = image.copy()
+            if not len(boxes):
+                return image
             
-            for face in faces:
-                x, y, w, h = face['x'], face['y'], face['width'], face['height']
-                
+            # Decoded frames are private to this call; only a read-only
+            # caller buffer needs copying before the faces are overwritten
+            if not image.flags.writeable:
+                image = image.copy()
+            
+            for x, y, w, h in boxes.tolist():
                 # Extract face region
-                face_region = blurred_image[y:y+h, x:x+w]
+                face_region = image[y:y+h, x:x+w]
                 
                 if face_region.size > 0:
-                    # Apply Gaussian blur
-                    blurred_face = cv2.GaussianBlur(face_region, (self.blur_strength, self.blur_strength), 0)
+                    kernel_size = self._face_kernel_size(w, h)
+                    if gpu_image is not None:
+                        blurred_face = self._blur_region_cuda(gpu_image, x, y, w, h, kernel_size)
+                        blurred_face = blurred_face[:, :, :image.shape[2]]
+                    elif kernel_size >= BOX_BLUR_MIN_KERNEL:
+                        # Two box passes approximate the Gaussian at a cost
+                        # independent of the kernel size
+                        box_size = _box_blur_size(kernel_size)
+                        box = (box_size, box_size)
+                        blurred_face = cv2.blur(cv2.blur(face_region, box), box)
+                    else:
+                        blurred_face = cv2.GaussianBlur(face_region, (kernel_size, kernel_size), 0)
                     
                     # Replace face region with blurred version
-                    blurred_image[y:y+h, x:x+w] = blurred_face
+                    image[y:y+h, x:x+w] = blurred_face
             
-            return blurred_image
+            return image
             
         except Exception as e:
             logger.error(f"Error blurring faces: {e}")
             return image
 
-    async def _encode_frame(self, image: np.ndarray) -> str:
-        """Encode processed image back to base64."""
+    def _blur_region_cuda(
+        self, gpu_image: Any, x: int, y: int, w: int, h: int, kernel_size: int
+    ) -> np.ndarray:
+        """Blur one region of an uploaded RGBA frame and download it."""
+        gaussian, passes = self._cuda_blur_filter(kernel_size)
+        region = cv2.cuda_GpuMat(gpu_image, (x, y, w, h))
+        for _ in range(passes):
+            region = gaussian.apply(region)
+        return region.download()
+
+    def _encode_frame(self, image: np.ndarray) -> bytes:
+        """Encode processed image as JPEG bytes."""
         try:
-            # Convert to PIL Image
-            pil_image = Image.fromarray(image)
-            
-            # Encode to base64
-            buffer = BytesIO()
-            pil_image.save(buffer, format='JPEG', quality=85)
-            image_bytes = buffer.getvalue()
-            
-            # Convert to base64 string
-            image_b64 = base64.b64encode(image_bytes).decode('utf-8')
-            
-            return f"data:image/jpeg;base64,{image_b64}"
+            if self.jpeg_encoder is not None:
+                # libjpeg-turbo reads RGB or RGBA directly, so no channel
+                # swap is needed
+                pixel_format = TJPF_RGBA if image.shape[2] == 4 else TJPF_RGB
+                return self.jpeg_encoder.encode(np.ascontiguousarray(image), quality=85, pixel_format=pixel_format)
+            
+            # OpenCV encodes BGR; alpha is dropped in the same pass
+            code = cv2.COLOR_RGBA2BGR if image.shape[2] == 4 else cv2.COLOR_RGB2BGR
+            image_bgr = cv2.cvtColor(image, code, dst=self._scratch("bgr", image.shape[:2] + (3,)))
+            ok, buffer = cv2.imencode('.jpg', image_bgr, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            if not ok:
+                logger.error("JPEG encoding failed")
+                return b""
+            
+            return buffer.tobytes()
             
         except Exception as e:
             logger.error(f"Error encoding frame: {e}")
-            return ""
+            return b""
 
     async def process_video_stream(self, frames: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process multiple frames for privacy protection."""
-        results = []
+        """Process multiple frames for privacy protection.
         
-        for i, frame in enumerate(frames):
-            try:
-                result = await self.blur_faces_in_frame(frame)
-                result['frame_index'] = i
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error processing frame {i}: {e}")
-                results.append({
+        Frames run concurrently on the executor; results keep input order.
+        Frames without a ``session_id`` are treated as one stream per call.
+        """
+        stream_id = object()
+        outcomes = await asyncio.gather(
+            *(self.blur_faces_in_frame(frame, frame.get("session_id", stream_id)) for frame in frames),
+            return_exceptions=True
+        )
+        with self._track_lock:
+            self._streams.pop(stream_id, None)
+        
+        results = []
+        for i, result in enumerate(outcomes):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing frame {i}: {result}")
+                result = {
                     'success': False,
-                    'frame_index': i,
-                    'error': str(e)
-                })
+                    'error': str(result)
+                }
+            result['frame_index'] = i
+            results.append(result)
         
         return results
 
@@ -299,6 +657,7 @@ class FaceBlurService:
             'face_padding': self.face_padding,
             'max_faces': self.max_faces,
             'process_scale': self.process_scale,
+            'detect_stride': self.detect_stride,
             'mediapipe_available': MEDIAPIPE_AVAILABLE
         }
 
@@ -322,9 +681,14 @@ class FaceBlurService:
             if 'process_scale' in settings:
                 self.process_scale = max(0.1, min(1.0, float(settings['process_scale'])))
             
-            # Reinitialize if detection confidence changed
+            if 'detect_stride' in settings:
+                self.detect_stride = max(1, min(10, int(settings['detect_stride'])))
+            
+            # FaceDetection's threshold is fixed at construction; executor
+            # threads rebuild theirs on their next frame instead of
+            # blocking this call on a graph rebuild
             if 'detection_confidence' in settings and MEDIAPIPE_AVAILABLE:
-                await self.initialize()
+                self._reset_detectors()
             
             return {
                 'success': True,
@@ -341,8 +705,16 @@ class FaceBlurService:
     async def cleanup(self) -> None:
         """Cleanup resources."""
         try:
-            if self.face_detection:
-                self.face_detection.close()
+            if self.executor:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+            detectors = list(self._detectors)
+            if self.face_detection is not None and self.face_detection not in detectors:
+                detectors.append(self.face_detection)
+            for detector in detectors:
+                detector.close()
+            self._detectors = []
+            self.face_detection = None
             self.is_initialized = False
             logger.info("Face blur service cleaned up")
         except Exception as e:
@@ -353,10 +725,12 @@ class FaceBlurService:
         return {
             'is_initialized': self.is_initialized,
             'mediapipe_available': MEDIAPIPE_AVAILABLE,
+            'cuda_enabled': self.use_cuda,
             'current_settings': {
                 'blur_strength': self.blur_strength,
                 'detection_confidence': self.detection_confidence,
                 'process_scale': self.process_scale,
-                'max_faces': self.max_faces
+                'max_faces': self.max_faces,
+                'detect_stride': self.detect_stride
             }
         }